@@ -1,4 +1,5 @@
 from fastapi import Header, HTTPException, status
+from app.utils.database import BOOKING_COLUMNS
 
 def admin_required(x_role: str = Header(...)):
     if x_role.lower() != "admin":
@@ -6,3 +7,22 @@ def admin_required(x_role: str = Header(...)):
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
+
+
+def field_projection(fields: str | None = None) -> tuple[str, ...]:
+    """
+    Columns requested with ?fields=id,date,time (all columns if omitted).
+
+    Used both for the SQL column list and the serialized output.
+    """
+    if not fields:
+        return BOOKING_COLUMNS
+
+    requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in BOOKING_COLUMNS]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown) or fields}. Allowed: {', '.join(BOOKING_COLUMNS)}"
+        )
+    return requested
@@ -1,14 +1,21 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from app.models.booking import Booking
-from app.utils.database import get_connection
-from app.core.response import success_response, error_response
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Response
+from app.models.booking import Booking, BookingUpdate, BookingBatchRequest
+from app.utils.database import get_connection, booking_source, is_slot_conflict
+from app.core.response import success_response, error_response, rows_payload, RecordJSONResponse
+from app.core.config import settings
 from app.core.idempotency import get_idempotency_key
-from app.api.dependencies import admin_required
+from app.core.etag import make_etag, etag_matches, get_if_match
+from app.services.booking_service import BookingService
+from app.services.recurrence import overlapping_series, series_occurrences
+from app.services.availability import find_free_slots, BUSINESS_DAY_MINUTES
+from app.api.dependencies import admin_required, field_projection
 from app.core.logging import logger
-from datetime import datetime
+from datetime import datetime, timedelta
+import calendar
 import sqlite3
 
 router = APIRouter(tags=["Bookings - v1"])
+booking_service = BookingService()
 
 #Create Booking
 @router.post("/", status_code=status.HTTP_201_CREATED)
@@ -16,35 +23,24 @@ def create_booking(
     b: Booking,
     idempotency_key: str = Depends(get_idempotency_key),
 ):
-    conn = get_connection()
-    cursor = conn.cursor()
-
     try:
-        cursor.execute("""
-            INSERT INTO bookings
-            (customer_name, customer_email, customer_phone, date, time, description)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            b.customer_name,
-            b.customer_email,
-            b.customer_phone,
-            str(b.date),
-            str(b.time),
-            b.description,
-        ))
-
-        conn.commit()
-        booking_id = cursor.lastrowid
-
-        cursor.execute("SELECT * FROM bookings WHERE id = ?", (booking_id,))
-        row = dict(cursor.fetchone())
-
-        return success_response(
-            data=row,
-            idempotency_key=idempotency_key,
-        )
-
-    except sqlite3.IntegrityError:
+        row = booking_service.create_booking(b)
+
+    except sqlite3.IntegrityError as e:
+        if is_slot_conflict(e):
+            # Offer the nearest free slots so clients do not retry blindly
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=error_response(
+                    code="SLOT_ALREADY_BOOKED",
+                    message="Selected time slot already booked",
+                    details={
+                        "date": str(b.date),
+                        "time": str(b.time),
+                        "alternatives": _nearest_alternatives(b),
+                    },
+                ),
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=error_response(
@@ -54,17 +50,23 @@ def create_booking(
             ),
         )
 
-    finally:
-        conn.close()
+    return RecordJSONResponse(
+        success_response(data=row, idempotency_key=idempotency_key),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 #Pagination + Filtering by date and customer_name
+#With date_filter, recurring-series occurrences on that day are listed under "occurrences"
 @router.get("/", status_code=status.HTTP_200_OK)
 def get_bookings(
     page: int = 1,
     limit: int = 5,
     date_filter: str | None = None,          #filter by specific date (YYYY-MM-DD)
     customer: str | None = None,           #filter by customer name (partial allowed)
+    include_archived: bool = False,        #also search bookings moved to the archive
+    columns: tuple[str, ...] = Depends(field_projection),   #?fields=id,date,time
+    compact: bool = False,                 #columnar response: names once, rows as arrays
 ):
     
     #Validate pagination input
@@ -82,9 +84,10 @@ def get_bookings(
     params = []
 
     #Filter by date (exact match)
+    filter_day = None
     if date_filter:
         try:
-            datetime.strptime(date_filter, "%Y-%m-%d")  # Validate date format
+            filter_day = datetime.strptime(date_filter, "%Y-%m-%d").date()  # Validate date format
             where_clauses.append("date = ?")
             params.append(date_filter)
             logger.info(f"Filtering bookings by date: {date_filter}")
@@ -105,25 +108,27 @@ def get_bookings(
     if where_clauses:
         where_sql = " WHERE " + " AND ".join(where_clauses)
     
-    cursor.execute(f"SELECT * FROM bookings{where_sql}", params)
-    rows = cursor.fetchall()
-    
-    if customer and not rows:
+    source = booking_source(include_archived)
+
+    #1) Count total filtered records
+    count_query = (f"SELECT COUNT(*) FROM {source}{where_sql}")
+    cursor.execute(count_query, params)
+    total = cursor.fetchone()[0]
+
+    # Series occurrences are not rows; expand them for the filtered day
+    occurrences = _day_occurrences(conn, filter_day, customer) if filter_day else []
+
+    if customer and not total and not occurrences:
+        conn.close()
         logger.info(f"No bookings found for customer name filter: {customer}")
         raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
         detail="No bookings found for this customer"
 )
 
-
-    #1) Count total filtered records
-    count_query = (f"SELECT COUNT(*) FROM bookings{where_sql}")
-    cursor.execute(count_query, params)
-    total = cursor.fetchone()[0]
-
-    #2) Fetch paginated + filtered results
+    #2) Fetch paginated + filtered results (only the requested columns)
     data_query = f"""
-        SELECT * FROM bookings
+        SELECT {", ".join(columns)} FROM {source}
         {where_sql}
         ORDER BY id DESC
         LIMIT ? OFFSET ?
@@ -135,25 +140,193 @@ def get_bookings(
     conn.close()
 
     logger.info(f"Fetched bookings - page: {page}, limit: {limit}, total_records: {total}")
-    return success_response(
+    return RecordJSONResponse(success_response(
         data={
         "total_records": total,
         "page": page,
         "limit": limit,
         "total_pages": (total + limit - 1) // limit,
-        "bookings": [dict(row) for row in rows]
+        "bookings": rows_payload(rows, columns, compact),
+        "occurrences": occurrences,
+        },
+    ))
+
+
+def _day_occurrences(conn, day, customer: str | None) -> list[dict]:
+    """Recurring-series occurrences on `day` (optionally by customer name), in time order."""
+    occurrences = [
+        {
+            "series_id": series["id"],
+            "customer_name": series["customer_name"],
+            "customer_email": series["customer_email"],
+            "customer_phone": series["customer_phone"],
+            "description": series["description"],
+            "date": str(day),
+            "time": series["time"],
+        }
+        for series in overlapping_series(conn, day, day)
+        if any(series_occurrences(series, day, day))
+        and (not customer or customer.lower() in series["customer_name"].lower())
+    ]
+    return sorted(occurrences, key=lambda o: o["time"])
+
+#Monthly occupancy (per day and per hour) from the summary tables plus recurring series
+@router.get("/calendar", status_code=status.HTTP_200_OK)
+def booking_calendar(month: str):
+    try:
+        first_day = datetime.strptime(month, "%Y-%m").date()
+    except ValueError:
+        logger.warning(f"Invalid month format provided for calendar: {month}")
+        raise HTTPException(status_code=400, detail="Invalid month format | use this YYYY-MM")
+
+    days_in_month = calendar.monthrange(first_day.year, first_day.month)[1]
+    next_month = first_day + timedelta(days=days_in_month)
+    bounds = (str(first_day), str(next_month))
+
+    days = {
+        str(first_day + timedelta(days=i)): {"bookings": 0, "hours": {}}
+        for i in range(days_in_month)
+    }
+
+    conn = get_connection()
+    try:
+        for row in conn.execute("""
+            SELECT date, bookings FROM booking_daily_counts
+            WHERE date >= ? AND date < ? AND bookings > 0
+        """, bounds):
+            days[row["date"]]["bookings"] = row["bookings"]
+
+        for row in conn.execute("""
+            SELECT date, hour, bookings FROM booking_hourly_counts
+            WHERE date >= ? AND date < ? AND bookings > 0
+        """, bounds):
+            days[row["date"]]["hours"][row["hour"]] = row["bookings"]
+
+        # Recurring series are not materialized; expand them for this month only
+        last_day = next_month - timedelta(days=1)
+        for series in overlapping_series(conn, first_day, last_day):
+            hour = int(series["time"][:2])
+            for day in series_occurrences(series, first_day, last_day):
+                counts = days[str(day)]
+                counts["bookings"] += 1
+                counts["hours"][hour] = counts["hours"].get(hour, 0) + 1
+    finally:
+        conn.close()
+
+    logger.info(f"Fetched occupancy calendar for month: {month}")
+    return success_response(
+        data={
+            "month": month,
+            "total_bookings": sum(day["bookings"] for day in days.values()),
+            "days": [{"date": d, **counts} for d, counts in days.items()],
+        },
+    )
+
+#Next free start times (business hours, SLOT_MINUTES grid) instead of guessing slots
+@router.get("/next-available", status_code=status.HTTP_200_OK)
+def next_available(
+    after: datetime | None = None,         #search from this date/time (default: now)
+    duration: int | None = None,           #minutes needed (default: one slot)
+    limit: int = 5,
+):
+    if not 1 <= limit <= settings.NEXT_AVAILABLE_MAX_LIMIT:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {settings.NEXT_AVAILABLE_MAX_LIMIT}.")
+    if duration is not None and not 1 <= duration <= BUSINESS_DAY_MINUTES:
+        raise HTTPException(status_code=400, detail=f"duration must be between 1 and {BUSINESS_DAY_MINUTES} minutes.")
+
+    if after and after.tzinfo:
+        # Slots are stored in server local time
+        after = after.astimezone().replace(tzinfo=None)
+    now = datetime.now()
+    start = max(after, now) if after else now
+
+    conn = get_connection()
+    try:
+        slots = find_free_slots(conn, start, duration, limit)
+    finally:
+        conn.close()
+
+    logger.info(f"Found {len(slots)} free slots after {start:%Y-%m-%d %H:%M} (duration={duration})")
+    return success_response(
+        data={
+            "after": start.isoformat(timespec="minutes"),
+            "duration_minutes": duration or settings.SLOT_MINUTES,
+            "slots": slots,
         },
     )
 
+
+def _nearest_alternatives(b: Booking) -> list[dict]:
+    conn = get_connection()
+    try:
+        # Never suggest a slot that has already started
+        start = max(datetime.combine(b.date, b.time), datetime.now())
+        return find_free_slots(conn, start, limit=settings.CONFLICT_ALTERNATIVES)
+    finally:
+        conn.close()
+
+#Batch fetch by IDs (results in request order, with not-found markers)
+def _batch_response(booking_ids: list[int], include_archived: bool):
+    found = booking_service.repository.get_many(booking_ids, include_archived)
+    results = [
+        {"id": booking_id, "found": True, "booking": found[booking_id]}
+        if booking_id in found else
+        {"id": booking_id, "found": False, "booking": None}
+        for booking_id in booking_ids
+    ]
+
+    logger.info(f"Batch fetched {len(found)} of {len(booking_ids)} requested bookings")
+    return RecordJSONResponse(success_response(
+        data={
+            "requested": len(booking_ids),
+            "found": sum(1 for r in results if r["found"]),
+            "results": results,
+        },
+    ))
+
+
+@router.get("/batch", status_code=status.HTTP_200_OK)
+def get_bookings_batch(ids: str, include_archived: bool = False):
+    try:
+        booking_ids = [int(i) for i in ids.split(",") if i.strip()]
+    except ValueError:
+        logger.warning(f"Invalid ids provided for batch fetch: {ids}")
+        raise HTTPException(status_code=400, detail="ids must be a comma separated list of integers")
+
+    if not booking_ids or len(booking_ids) > settings.BATCH_GET_MAX_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Provide between 1 and {settings.BATCH_GET_MAX_IDS} ids "
+                f"(use POST /batch for up to {settings.BATCH_MAX_IDS})"
+            )
+        )
+
+    return _batch_response(booking_ids, include_archived)
+
+
+@router.post("/batch", status_code=status.HTTP_200_OK)
+def post_bookings_batch(request: BookingBatchRequest, include_archived: bool = False):
+    return _batch_response(request.ids, include_archived)
+
 #search by ID or NAME
 @router.get("/search/{search_value}", status_code=status.HTTP_200_OK)
-def get_booking(booking_id_or_name : str):
+def get_booking(
+    search_value: str,
+    include_archived: bool = False,
+    if_none_match: str | None = Header(None, alias="If-None-Match"),
+    columns: tuple[str, ...] = Depends(field_projection),
+    compact: bool = False,
+):
     conn = get_connection()
     cursor = conn.cursor()
+    source = booking_source(include_archived)
 
     try:
-        booking_id = int(booking_id_or_name)
-        cursor.execute("SELECT * FROM bookings WHERE id = ?",(booking_id,))
+        booking_id = int(search_value)
+        # version is always read for the ETag, even when not requested
+        selected = columns if "version" in columns else (*columns, "version")
+        cursor.execute(f"SELECT {', '.join(selected)} FROM {source} WHERE id = ?",(booking_id,))
         row = cursor.fetchone()
         logger.info(f"Searching booking by ID: {booking_id}")
         
@@ -161,103 +334,88 @@ def get_booking(booking_id_or_name : str):
             logger.warning(f"Booking not found for ID: {booking_id}")
             raise HTTPException(status_code=404, detail="Booking not found")
         
-        #return single row for ID
+        #return single row for ID, or 304 if the client already has this version
+        etag = make_etag(row["version"], columns)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        # Drop the extra version column unless it was asked for
+        result = row if len(selected) == len(columns) else {c: row[c] for c in columns}
         logger.info(f"Booking found for ID: {booking_id}")
-        return success_response(
-            data={"search_type": "id", "result": dict(row)},
+        return RecordJSONResponse(
+            success_response(data={"search_type": "id", "result": result}),
+            headers={"ETag": etag},
         )
 
     except ValueError:
-        logger.info(f"Searching bookings by customer name containing: {booking_id_or_name}")
-        cursor.execute("""
-        SELECT * FROM bookings
+        logger.info(f"Searching bookings by customer name containing: {search_value}")
+        cursor.execute(f"""
+        SELECT {", ".join(columns)} FROM {source}
         WHERE LOWER(customer_name) LIKE LOWER(?)
-        """,(f"%{booking_id_or_name}%",))
+        """,(f"%{search_value}%",))
 
         rows = cursor.fetchall()
 
         if not rows:
-            logger.error(f"No bookings found for customer name containing: {booking_id_or_name}")
+            logger.error(f"No bookings found for customer name containing: {search_value}")
             raise HTTPException(status_code=404, detail="Booking Not Found That ID | Name... | Try Again..")
         
         #return multiple result(for name)
-        logger.info(f"Found {len(rows)} bookings for customer name containing: {booking_id_or_name}")
-        return success_response(
+        logger.info(f"Found {len(rows)} bookings for customer name containing: {search_value}")
+        return RecordJSONResponse(success_response(
             data={
                 "search_type": "name",
                 "total_results": len(rows),
-                "results": [dict(row) for row in rows],
+                "results": rows_payload(rows, columns, compact),
             }
-)
+        ))
 
     finally:
         conn.close()
 
-# Update Booking
+# Update Booking (If-Match: "<version>" makes it conditional)
 @router.put("/{booking_id}", status_code=status.HTTP_200_OK)
-def update_booking(booking_id: int, b: Booking, idempotency_key: str = Depends(get_idempotency_key)):
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT * FROM bookings WHERE id = ?", (booking_id,))
-    old = cursor.fetchone()
-    if not old:
-        conn.close()
-        logger.warning(f"Booking not found for update with ID: {booking_id}")
-        raise HTTPException(status_code=404, detail="Booking not found")
-
-    changed_fields = []
-
-    if old["customer_name"] != b.customer_name:
-        changed_fields.append("customer_name")
-
-    if old["customer_email"] != b.customer_email:
-        changed_fields.append("customer_email")
-
-    if old["customer_phone"] != b.customer_phone:
-        changed_fields.append("customer_phone")
-
-    if old["date"] != str(b.date):
-        changed_fields.append("date")
+def update_booking(
+    booking_id: int,
+    b: Booking,
+    expected_version: int | None = Depends(get_if_match),
+    idempotency_key: str = Depends(get_idempotency_key),
+):
+    try:
+        row, changed_fields = booking_service.update_booking(booking_id, b, expected_version)
 
-    if old["time"] != str(b.time):
-        changed_fields.append("time")
+    except sqlite3.IntegrityError:
+        raise HTTPException(
+            status_code=409,
+            detail=error_response(
+                code="SLOT_ALREADY_BOOKED",
+                message="Selected time slot already booked"
+            )
+        )
 
-    if old["description"] != b.description:
-        changed_fields.append("description")
+    logger.info(f"Booking with ID: {booking_id} updated successfully. Changed fields: {changed_fields}")
+    return RecordJSONResponse(
+        success_response(
+            data={
+                "info": row,
+                "booking_id": booking_id,
+                "updated_fields": changed_fields
+            },
+            idempotency_key=idempotency_key
+        ),
+        headers={"ETag": make_etag(row["version"])},
+    )
 
+# Partial Update Booking (only the fields sent are validated and written)
+@router.patch("/{booking_id}", status_code=status.HTTP_200_OK)
+def patch_booking(
+    booking_id: int,
+    b: BookingUpdate,
+    expected_version: int | None = Depends(get_if_match),
+    idempotency_key: str = Depends(get_idempotency_key),
+):
     try:
-        # Update booking
-        cursor.execute("""
-            UPDATE bookings
-            SET customer_name=?, customer_email=?, customer_phone=?,
-                date=?, time=?, description=?,
-                version=version+1,
-                updated_at=CURRENT_TIMESTAMP
-            WHERE id=?
-        """, (
-            b.customer_name,
-            b.customer_email,
-            b.customer_phone,
-            str(b.date),
-            str(b.time),
-            b.description,
-            booking_id
-        ))
-
-        # Save history
-        if changed_fields:
-            cursor.execute("""
-                INSERT INTO booking_history
-                (booking_id, updated_fields, updated_by)
-                VALUES (?, ?, ?)
-            """, (
-                booking_id,
-                ", ".join(changed_fields),
-                "admin"
-            ))
-
-        conn.commit()
+        row, changed_fields = booking_service.patch_booking(booking_id, b, expected_version)
 
     except sqlite3.IntegrityError:
         raise HTTPException(
@@ -267,35 +425,27 @@ def update_booking(booking_id: int, b: Booking, idempotency_key: str = Depends(g
                 message="Selected time slot already booked"
             )
         )
-    finally:
-        conn.close()
 
-    logger.info(f"Booking with ID: {booking_id} updated successfully. Changed fields: {changed_fields}")
-    return success_response(
-        data={
-            "info": b.dict(),
-            "booking_id": booking_id,
-            "updated_fields": changed_fields
-        },
-        idempotency_key=idempotency_key
+    logger.info(f"Booking with ID: {booking_id} patched. Changed fields: {changed_fields}")
+    return RecordJSONResponse(
+        success_response(
+            data={
+                "info": row,
+                "booking_id": booking_id,
+                "updated_fields": changed_fields
+            },
+            idempotency_key=idempotency_key
+        ),
+        headers={"ETag": make_etag(row["version"])},
     )
 
 #Cancel Booking
 @router.delete("/{booking_id}", status_code=status.HTTP_200_OK)
 def delete_booking(booking_id: int, idempotency_key: str = Depends(get_idempotency_key)):
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT * FROM bookings WHERE id = ?", (booking_id,))
-    if not cursor.fetchone():
-        conn.close()
+    if not booking_service.delete_booking(booking_id):
         logger.warning(f"Booking not found for deletion with ID: {booking_id}")
         raise HTTPException(status_code=404, detail="Booking not found")
 
-    cursor.execute("DELETE FROM bookings WHERE id = ?", (booking_id,))
-    conn.commit()
-    conn.close()
-
     logger.info(f"Booking with ID: {booking_id} deleted successfully")
     return success_response(
         data={"message": "Your Booking Is Canceled Successfully...!"},
@@ -0,0 +1,79 @@
+import asyncio
+import json
+from datetime import date
+
+from fastapi import APIRouter, Header, Request
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.response import json_default
+from app.services.change_feed import get_change_feed
+
+router = APIRouter(tags=["Booking Changes - v1"])
+
+
+def _sse(event_id: str, event: dict) -> str:
+    return f"id: {event_id}\nevent: {event['type']}\ndata: {json.dumps(event, default=json_default)}\n\n"
+
+
+#Server-Sent Events stream of booking changes (replaces polling the list)
+@router.get("/stream")
+async def stream_changes(
+    request: Request,
+    since: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Push created/updated/deleted booking events as they commit.
+
+    Event ids are "<origin>:<seq>"; resume with ?since=<id> or the
+    standard Last-Event-ID header. An id this process cannot resume from
+    (restart, another worker, history or buffer exceeded) gets a "reset"
+    event: re-sync with GET /api/v1/bookings, then keep reading.
+    date_from/date_to limit events to bookings on those dates.
+
+    Event shapes (SSE data, JSON):
+    - created/updated/deleted: {seq, ts, type, booking_id, date, booking}
+    - reset: {seq, ts, type, reason} -- re-sync. Bulk changes (reason
+      "bulk_import") add date_from/date_to, the range they touched, and
+      are only sent to subscribers whose dates overlap it
+    """
+    if since is None:
+        since = last_event_id or None
+
+    feed = get_change_feed()
+    subscriber = feed.subscribe(
+        since,
+        str(date_from) if date_from else None,
+        str(date_to) if date_to else None,
+    )
+    logger.info(f"Change feed subscriber connected (since={since})")
+
+    async def events():
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscriber.queue.get(), settings.CHANGE_FEED_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if event["type"] == "disconnect":
+                    yield f"event: disconnect\ndata: {json.dumps(event)}\n\n"
+                    break
+                yield _sse(feed.event_id(event), event)
+        finally:
+            feed.unsubscribe(subscriber)
+            logger.info("Change feed subscriber disconnected")
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
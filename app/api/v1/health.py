@@ -2,6 +2,7 @@ from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 from app.utils.database import check_db_connection
 from app.utils.cache import check_redis_connection
+from app.core.startup import startup
 
 router = APIRouter(tags=["Health"])
 
@@ -13,18 +14,26 @@ async def health_check():
 
     Returns:
     - 200 OK: All systems operational
-    - 503 Service Unavailable: Database down
+    - 503 Service Unavailable: Database down or startup not finished
 
     Response includes:
     - Database connectivity
     - Redis connectivity
     - Application version
+    - Startup phase timings (ms)
     """
 
+    if not startup.ready:
+        return JSONResponse(
+            content={"status": "starting", "startup": startup.phases},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
     response = {
         "status": "healthy",
         "version": "1.0.0",
-        "checks": {}
+        "checks": {},
+        "startup": startup.phases
     }
 
     http_status = status.HTTP_200_OK
@@ -0,0 +1,86 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from app.models.booking import Booking, SlotHoldRequest
+from app.utils.write_queue import run_write
+from app.core.response import success_response, error_response, RecordJSONResponse
+from app.core.idempotency import get_idempotency_key
+from app.core.logging import logger
+from app.services.booking_service import BookingService
+from app.services.slot_holds import get_slot_holds
+from app.services.slot_service import ensure_slot_open
+import sqlite3
+
+router = APIRouter(tags=["Slot Holds - v1"])
+booking_service = BookingService()
+
+
+#Hold a slot for a few minutes (blocks other bookings of the same slot)
+@router.post("/", status_code=status.HTTP_201_CREATED)
+def create_hold(
+    h: SlotHoldRequest,
+    idempotency_key: str = Depends(get_idempotency_key),
+):
+    slot_date, slot_time = str(h.date), str(h.time)
+
+    # Checked and registered on the writer, so no booking insert can interleave
+    def hold_slot(conn):
+        ensure_slot_open(conn, slot_date, slot_time)
+        return get_slot_holds().create(slot_date, slot_time, h.ttl_seconds)
+
+    try:
+        hold = run_write(hold_slot)
+
+    except sqlite3.IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=error_response(
+                code="SLOT_ALREADY_BOOKED",
+                message="Selected time slot is already booked or held",
+                details={"date": slot_date, "time": slot_time},
+            ),
+        )
+
+    logger.info(f"Slot {slot_date} {slot_time} held for {h.ttl_seconds}s (hold {hold.hold_id})")
+    return success_response(
+        data={**hold.to_dict(), "ttl_seconds": h.ttl_seconds},
+        idempotency_key=idempotency_key,
+    )
+
+
+#Convert a hold into a real booking
+@router.post("/{hold_id}/confirm", status_code=status.HTTP_201_CREATED)
+def confirm_hold(
+    hold_id: str,
+    b: Booking,
+    idempotency_key: str = Depends(get_idempotency_key),
+):
+    try:
+        row = booking_service.confirm_hold(hold_id, b)
+
+    except sqlite3.IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=error_response(
+                code="SLOT_ALREADY_BOOKED",
+                message=f"{b.customer_email} - This email ID is already reserved. Please use a different email.",
+                details={"date": str(b.date), "time": str(b.time)},
+            ),
+        )
+
+    logger.info(f"Hold {hold_id} confirmed as booking {row['id']}")
+    return RecordJSONResponse(
+        success_response(data=row, idempotency_key=idempotency_key),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+#Release a hold early
+@router.delete("/{hold_id}", status_code=status.HTTP_200_OK)
+def release_hold(hold_id: str, idempotency_key: str = Depends(get_idempotency_key)):
+    if not get_slot_holds().release(hold_id):
+        logger.warning(f"Slot hold not found for release: {hold_id}")
+        raise HTTPException(status_code=404, detail="Slot hold not found or expired")
+
+    return success_response(
+        data={"message": "Slot hold released"},
+        idempotency_key=idempotency_key
+    )
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, File, UploadFile, status
+from app.core.response import success_response
+from app.core.idempotency import get_idempotency_key
+from app.core.logging import logger
+from app.services.import_service import import_bookings_csv
+
+router = APIRouter(tags=["Booking Import - v1"])
+
+
+#Bulk import bookings from a CSV upload (validated in parallel, inserted in batches)
+@router.post("/", status_code=status.HTTP_200_OK)
+def import_bookings(
+    file: UploadFile = File(...),
+    idempotency_key: str = Depends(get_idempotency_key),
+):
+    """
+    Columns: customer_name, customer_email, customer_phone, date, time
+    and optionally description. Every row is validated like POST
+    /api/v1/bookings; the response counts imported/rejected rows and
+    lists the errors by CSV line number.
+    """
+    logger.info(f"Importing bookings from uploaded CSV: {file.filename}")
+    report = import_bookings_csv(file.file)
+    return success_response(
+        data=report,
+        idempotency_key=idempotency_key,
+    )
@@ -0,0 +1,153 @@
+from datetime import date
+from heapq import merge
+from itertools import islice
+
+from fastapi import APIRouter, HTTPException, status, Depends
+from app.models.booking import BookingSeries
+from app.utils.database import get_connection
+from app.utils.write_queue import run_write
+from app.core.response import success_response, error_response
+from app.core.idempotency import get_idempotency_key
+from app.core.logging import logger
+from app.services.slot_holds import get_slot_holds
+from app.services.recurrence import (
+    booking_conflicts,
+    iter_occurrences,
+    last_occurrence,
+    overlapping_series,
+    series_conflicts,
+    series_occurrences,
+)
+
+router = APIRouter(tags=["Booking Series - v1"])
+
+
+#Create a recurring series (all occurrences conflict-checked in one go)
+@router.post("/", status_code=status.HTTP_201_CREATED)
+def create_series(
+    s: BookingSeries,
+    idempotency_key: str = Depends(get_idempotency_key),
+):
+    end_date = last_occurrence(s.start_date, s.freq, s.interval, s.count, s.until)
+    dates = list(iter_occurrences(s.start_date, end_date, s.freq, s.interval))
+    slot_time = str(s.time)
+
+    def insert_series(conn):
+        holds = get_slot_holds()
+        conflicts = sorted(
+            set(booking_conflicts(conn, slot_time, dates))
+            | set(series_conflicts(conn, slot_time, dates))
+            | {str(d) for d in dates if holds.is_held(str(d), slot_time)}
+        )
+        if conflicts:
+            return None, conflicts
+
+        cursor = conn.execute("""
+            INSERT INTO booking_series
+            (customer_name, customer_email, customer_phone, description,
+             time, start_date, end_date, freq, interval, count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING *
+        """, (
+            s.customer_name,
+            s.customer_email,
+            s.customer_phone,
+            s.description,
+            slot_time,
+            str(s.start_date),
+            str(end_date),
+            s.freq,
+            s.interval,
+            s.count,
+        ))
+        return dict(cursor.fetchone()), []
+
+    series, conflicts = run_write(insert_series)
+
+    if conflicts:
+        logger.warning(f"Series rejected, {len(conflicts)} occurrences conflict at {slot_time}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=error_response(
+                code="SLOT_ALREADY_BOOKED",
+                message="Some occurrences of this series are already booked",
+                details={"time": slot_time, "conflicting_dates": conflicts},
+            ),
+        )
+
+    logger.info(f"Created booking series {series['id']} with {len(dates)} occurrences")
+    return success_response(
+        data={**series, "total_occurrences": len(dates)},
+        idempotency_key=idempotency_key,
+    )
+
+
+#All series occurrences inside a date window, in date/time order
+@router.get("/occurrences", status_code=status.HTTP_200_OK)
+def list_occurrences(start: date, end: date, limit: int = 100):
+    if end < start or limit < 1:
+        raise HTTPException(status_code=400, detail="end must not be before start and limit must be positive.")
+
+    conn = get_connection()
+    try:
+        series_rows = overlapping_series(conn, start, end)
+    finally:
+        conn.close()
+
+    # Each series is expanded lazily and only within the window
+    streams = [
+        ((str(d), s["time"], s["id"]) for d in series_occurrences(s, start, end))
+        for s in series_rows
+    ]
+    occurrences = [
+        {"series_id": series_id, "date": d, "time": t}
+        for d, t, series_id in islice(merge(*streams), limit)
+    ]
+
+    logger.info(f"Expanded {len(occurrences)} occurrences from {len(series_rows)} series between {start} and {end}")
+    return success_response(
+        data={"start": str(start), "end": str(end), "occurrences": occurrences},
+    )
+
+
+#One series with its occurrences inside an optional window
+@router.get("/{series_id}", status_code=status.HTTP_200_OK)
+def get_series(
+    series_id: int,
+    start: date | None = None,
+    end: date | None = None,
+    limit: int = 100,
+):
+    conn = get_connection()
+    try:
+        series = conn.execute(
+            "SELECT * FROM booking_series WHERE id = ?", (series_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+
+    if not series:
+        logger.warning(f"Booking series not found for ID: {series_id}")
+        raise HTTPException(status_code=404, detail="Booking series not found")
+
+    occurrences = [str(d) for d in islice(series_occurrences(series, start, end), max(limit, 0))]
+    return success_response(
+        data={**dict(series), "occurrences": occurrences},
+    )
+
+
+#Cancel a whole series
+@router.delete("/{series_id}", status_code=status.HTTP_200_OK)
+def delete_series(series_id: int, idempotency_key: str = Depends(get_idempotency_key)):
+    deleted = run_write(
+        lambda conn: conn.execute("DELETE FROM booking_series WHERE id = ?", (series_id,)).rowcount
+    )
+    if not deleted:
+        logger.warning(f"Booking series not found for deletion with ID: {series_id}")
+        raise HTTPException(status_code=404, detail="Booking series not found")
+
+    logger.info(f"Booking series with ID: {series_id} deleted successfully")
+    return success_response(
+        data={"message": "Your Booking Series Is Canceled Successfully...!"},
+        idempotency_key=idempotency_key
+    )
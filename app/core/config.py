@@ -1,3 +1,4 @@
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -9,11 +10,89 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "booking.db"
 
+    # Write queue (single writer, group commit)
+    WRITE_BATCH_SIZE: int = 256
+    WRITE_BATCH_WAIT_MS: float = 0
+    WRITE_TIMEOUT_SECONDS: float = 30
+
+    # Archival of past bookings
+    ARCHIVE_ENABLED: bool = True
+    ARCHIVE_AFTER_DAYS: int = 30
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_INTERVAL_SECONDS: int = 3600
+
+    # Recurring bookings
+    MAX_SERIES_OCCURRENCES: int = 366
+
+    # Next available slot search
+    SLOT_MINUTES: int = 30
+    NEXT_AVAILABLE_MAX_DAYS: int = 90
+    NEXT_AVAILABLE_MAX_LIMIT: int = 50
+    CONFLICT_ALTERNATIVES: int = 3
+
+    # CSV bulk import
+    IMPORT_CHUNK_SIZE: int = 2000
+    IMPORT_WORKERS: int = 0  # 0 = one per CPU
+    IMPORT_MAX_INFLIGHT_CHUNKS: int = 0  # 0 = two per worker
+    IMPORT_MAX_ERRORS: int = 1000
+
+    # Batch fetch
+    BATCH_MAX_IDS: int = 5000  # POST /batch body (queried in chunks)
+    BATCH_GET_MAX_IDS: int = 200  # GET /batch?ids=, keeps the URL short
+
+    # Temporary slot holds
+    HOLD_TTL_SECONDS: int = 300
+    HOLD_MAX_TTL_SECONDS: int = 1800
+    HOLD_SWEEP_SECONDS: int = 5
+    HOLD_CONFIRM_TIMEOUT_SECONDS: int = 60  # Redis TTL of a hold being confirmed
+    HOLDS_REDIS_ENABLED: bool = False
+
+    # Change feed (SSE)
+    CHANGE_FEED_HISTORY: int = 1000
+    CHANGE_FEED_BUFFER: int = 100
+    CHANGE_FEED_KEEPALIVE_SECONDS: float = 15
+    CHANGE_FEED_REDIS_ENABLED: bool = False
+    CHANGE_FEED_REDIS_CHANNEL: str = "booking_changes"
+
+    # Load shedding (rate limits and adaptive concurrency)
+    LOAD_SHEDDING_ENABLED: bool = True
+    THREADPOOL_SIZE: int = 40  # READ_ + WRITE_CONCURRENCY_MAX must fit in it
+    RATE_LIMIT_PER_SECOND: float = 50
+    RATE_LIMIT_BURST: float = 100
+    RATE_LIMIT_MAX_CLIENTS: int = 10000
+    READ_CONCURRENCY_INITIAL: int = 16
+    READ_CONCURRENCY_MIN: int = 4
+    READ_CONCURRENCY_MAX: int = 28
+    READ_TARGET_LATENCY_MS: float = 100
+    WRITE_CONCURRENCY_INITIAL: int = 8
+    WRITE_CONCURRENCY_MIN: int = 2
+    WRITE_CONCURRENCY_MAX: int = 12
+    WRITE_TARGET_LATENCY_MS: float = 200
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
     class Config:
         env_file = ".env"
 
+    @model_validator(mode="after")
+    def validate_concurrency_limits(self):
+        # Admitted requests beyond the threadpool would queue in it, which
+        # is exactly what the adaptive limits are there to prevent
+        if self.READ_CONCURRENCY_MAX + self.WRITE_CONCURRENCY_MAX > self.THREADPOOL_SIZE:
+            raise ValueError(
+                "READ_CONCURRENCY_MAX + WRITE_CONCURRENCY_MAX must not exceed THREADPOOL_SIZE"
+            )
+        for kind in ("READ", "WRITE"):
+            low, initial, high = (
+                getattr(self, f"{kind}_CONCURRENCY_{name}") for name in ("MIN", "INITIAL", "MAX")
+            )
+            if not 1 <= low <= initial <= high:
+                raise ValueError(
+                    f"Expected 1 <= {kind}_CONCURRENCY_MIN <= {kind}_CONCURRENCY_INITIAL"
+                    f" <= {kind}_CONCURRENCY_MAX"
+                )
+        return self
+
 
 settings = Settings()
@@ -0,0 +1,64 @@
+import hashlib
+from typing import Optional, Sequence
+
+from fastapi import Header, HTTPException, status
+
+from app.utils.database import BOOKING_COLUMNS
+
+
+def make_etag(version: int, columns: Sequence[str] = BOOKING_COLUMNS) -> str:
+    """
+    ETag for one representation of a booking version.
+
+    A ?fields= projection is a different representation of the same
+    version, so it gets its own tag ("<version>-<hash of columns>");
+    otherwise a projected ETag would earn a 304 for the full resource.
+    """
+    if tuple(columns) == BOOKING_COLUMNS:
+        return f'"{version}"'
+    digest = hashlib.blake2s(",".join(columns).encode(), digest_size=4).hexdigest()
+    return f'"{version}-{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    return tag.strip('"')
+
+
+def _parse_version(tag: str) -> Optional[int]:
+    # Any representation's tag names the version it was read at
+    try:
+        return int(_opaque(tag).split("-")[0])
+    except ValueError:
+        return None
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True when an If-None-Match header already names this ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(_opaque(tag) == _opaque(etag) for tag in if_none_match.split(","))
+
+
+def get_if_match(
+    if_match: Optional[str] = Header(None, alias="If-Match")
+) -> Optional[int]:
+    """
+    Expected booking version from the If-Match header.
+
+    Returns None when the header is absent or "*" (unconditional update).
+    """
+    if not if_match or if_match.strip() == "*":
+        return None
+
+    version = _parse_version(if_match.split(",")[0])
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="If-Match must be an ETag returned by this API",
+        )
+    return version
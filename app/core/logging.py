@@ -2,7 +2,18 @@ import logging
 import os
 
 LOG_DIR = "logs"
-os.makedirs(LOG_DIR, exist_ok=True)
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that creates the log directory and file on first write."""
+
+    def __init__(self, filename):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
 
 logger = logging.getLogger("booking_logger")
 logger.setLevel(logging.DEBUG)
@@ -12,7 +23,7 @@ formatter = logging.Formatter(
 )
 
 # File handler
-file_handler = logging.FileHandler(f"{LOG_DIR}/booking_app.log")
+file_handler = _LazyFileHandler(f"{LOG_DIR}/booking_app.log")
 file_handler.setLevel(logging.DEBUG)
 file_handler.setFormatter(formatter)
 
@@ -24,4 +35,3 @@ console_handler.setFormatter(formatter)
 if not logger.handlers:
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
-logger.info("Logging is set up.")
\ No newline at end of file
@@ -1,5 +1,11 @@
+import json
+from datetime import date, datetime, time
 from uuid import uuid4
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
+
+from fastapi.responses import JSONResponse
+
+from app.utils.records import Record
 
 
 def success_response(
@@ -29,3 +35,51 @@ def error_response(
             "details": details,
         },
     }
+
+
+def rows_payload(
+    rows: Sequence[Record],
+    columns: Sequence[str],
+    compact: bool = False,
+):
+    """
+    Serialize result rows as a list of objects, or in compact columnar
+    form: {"columns": [...], "rows": [[...], ...]} with names sent once.
+
+    The rows are passed through as-is for RecordJSONResponse to encode;
+    their layout already matches `columns` since the SELECT used them.
+    """
+    if compact:
+        return {"columns": list(columns), "rows": [row.values() for row in rows]}
+    return list(rows)
+
+
+def json_default(value: Any):
+    """json.dumps fallback for Records and the date/time types they may hold."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class RecordJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by json.dumps(default=json_default).
+
+    Endpoints return it directly, so FastAPI skips jsonable_encoder and
+    its recursive copy of the payload. Each Record becomes a plain dict
+    only as json.dumps reaches it (json_default), so one row's dict is
+    alive at a time rather than a dict per row for the whole result.
+    Compact responses encode the values tuples as they are. Headers set
+    on an injected Response are not merged; pass them here instead.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json.dumps(
+            content,
+            default=json_default,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
@@ -0,0 +1,34 @@
+import time
+from typing import Dict
+
+from app.core.logging import logger
+
+
+class StartupTimer:
+    """
+    Records how long each startup phase takes.
+
+    The clock starts when this module is first imported (the top of
+    app/main.py), so the first mark covers application imports.
+    """
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self._last = self._started
+        self.phases: Dict[str, float] = {}
+        self.ready = False
+
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._last) * 1000, 2)
+        self._last = now
+
+    def complete(self):
+        total = round((time.perf_counter() - self._started) * 1000, 2)
+        self.phases["total"] = total
+        self.ready = True
+        summary = ", ".join(f"{name}={ms}ms" for name, ms in self.phases.items())
+        logger.info(f"Startup complete: {summary}")
+
+
+startup = StartupTimer()
@@ -1,24 +1,71 @@
+from app.core.startup import startup
+
+import asyncio
 from contextlib import asynccontextmanager
 from logging import getLogger
-from fastapi import FastAPI
+import anyio.to_thread
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
 from app.api.v1.booking import router as bookings_v1
-from app.utils.database import create_tables
+from app.api.v1.series import router as series_v1
+from app.api.v1.holds import router as holds_v1
+from app.api.v1.changes import router as changes_v1
+from app.api.v1.imports import router as imports_v1
+from app.api.v1.health import router as health_router
+from app.core.config import settings
+from app.core.response import error_response
+from app.middleware.load_shedding import LoadSheddingMiddleware
+from app.services.archive_service import run_archiver
+from app.services.slot_holds import run_hold_sweeper
+from app.services.change_feed import get_change_feed
+from app.services.import_service import shutdown_import_pool
+from app.utils.database import ensure_schema, warm_up
+from app.utils.write_queue import WriteTimeoutError, get_write_queue
 
 logger = getLogger("booking_logger")
+startup.mark("imports")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up the Booking API server...")
-    create_tables()
-    logger.info("Database tables created")
+    # Threads available to sync handlers
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    if ensure_schema():
+        logger.info("Database schema created/upgraded")
+    startup.mark("schema")
+
+    # Open the writer connection and touch hot pages before reporting ready
+    write_queue = get_write_queue()
+    write_queue.start()
+    write_queue.execute(lambda conn: None)
+    warm_up()
+    startup.mark("warmup")
+
+    archiver = asyncio.create_task(run_archiver()) if settings.ARCHIVE_ENABLED else None
+    hold_sweeper = asyncio.create_task(run_hold_sweeper())
+
+    change_feed = get_change_feed()
+    change_feed.bind_loop(asyncio.get_running_loop())
+    feed_listener = (
+        asyncio.create_task(change_feed.listen_redis())
+        if settings.CHANGE_FEED_REDIS_ENABLED else None
+    )
+    startup.complete()
 
     yield  # App runs here
 
     # Shutdown
     logger.info("Shutting down the Booking API server...")
+    if archiver:
+        archiver.cancel()
+    hold_sweeper.cancel()
+    if feed_listener:
+        feed_listener.cancel()
+    shutdown_import_pool()
+    write_queue.stop()
 
 
 app = FastAPI(
@@ -28,4 +75,30 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+
+@app.exception_handler(WriteTimeoutError)
+async def write_timeout_handler(request: Request, exc: WriteTimeoutError):
+    # The writer is backed up: ask the client to come back, and say whether
+    # the write may have landed so a retried create is not a surprise 409
+    return JSONResponse(
+        status_code=503,
+        content=error_response(
+            code="WRITE_OUTCOME_UNKNOWN" if exc.started else "WRITE_NOT_APPLIED",
+            message=(
+                "The write may still be applied; check before retrying"
+                if exc.started else "The write was not applied; retry later"
+            ),
+        ),
+        headers={"Retry-After": "1"},
+    )
+
+
+if settings.LOAD_SHEDDING_ENABLED:
+    app.add_middleware(LoadSheddingMiddleware)
+
+app.include_router(series_v1, prefix="/api/v1/bookings/series")
+app.include_router(holds_v1, prefix="/api/v1/bookings/holds")
+app.include_router(changes_v1, prefix="/api/v1/bookings/changes")
+app.include_router(imports_v1, prefix="/api/v1/bookings/import")
 app.include_router(bookings_v1, prefix="/api/v1/bookings")
+app.include_router(health_router)
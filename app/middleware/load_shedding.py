@@ -0,0 +1,192 @@
+import json
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.config import settings
+from app.core.logging import logger
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> Tuple[bool, float]:
+        """Take one token; returns (allowed, seconds until a token is available)."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True, 0.0
+        return False, (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Per-client token buckets, keeping at most max_clients (LRU)."""
+
+    def __init__(self, rate: float, burst: float, max_clients: int):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    def take(self, client_key: str) -> Tuple[bool, float]:
+        bucket = self._buckets.get(client_key)
+        if bucket is None:
+            bucket = self._buckets[client_key] = TokenBucket(self.rate, self.burst)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client_key)
+        return bucket.take()
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit driven by observed latency.
+
+    Each request that finishes under target_latency grows the limit by
+    1/limit (about +1 per limit's worth of requests); a slow or
+    overloaded one shrinks it by `backoff`, at most once per window:
+    requests admitted before the last decrease cannot trigger another,
+    so a burst of slow completions backs off once. Requests over the
+    limit are rejected immediately instead of queueing in the threadpool.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        target_latency: float,
+        backoff: float = 0.9,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.backoff = backoff
+        self.inflight = 0
+        self._admitted = 0  # sequence number of the last admitted request
+        self._backoff_seq = 0  # _admitted at the last decrease
+
+    def try_acquire(self) -> Optional[int]:
+        """Admit a request; returns its sequence number, or None if over the limit."""
+        if self.inflight >= math.floor(self.limit):
+            return None
+        self.inflight += 1
+        self._admitted += 1
+        return self._admitted
+
+    def release(self, seq: int, latency: Optional[float], overloaded: bool = False):
+        """Finish request `seq`; a latency of None gives no feedback."""
+        self.inflight -= 1
+        if overloaded or (latency is not None and latency > self.target_latency):
+            if seq > self._backoff_seq:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._backoff_seq = self._admitted
+        elif latency is not None:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+
+def _reject(status_code: int, code: str, message: str, retry_after: float) -> Response:
+    return Response(
+        content=json.dumps({
+            "status": "error",
+            "error": {
+                "code": code,
+                "message": message
+            }
+        }),
+        status_code=status_code,
+        media_type="application/json",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+    )
+
+
+class LoadSheddingMiddleware(BaseHTTPMiddleware):
+    """
+    Admission control in front of the (threadpool + SQLite) handlers.
+
+    Implementation Notes:
+    1. Per-client token bucket keyed by client IP -> 429 (X-API-Key is
+       not authenticated, so keying on it would let a client mint fresh
+       buckets and evict others'). Behind a reverse proxy every request
+       comes from the proxy's IP; run uvicorn with --proxy-headers and
+       --forwarded-allow-ips=<proxy IPs> so request.client is the
+       X-Forwarded-For address, and only when set by a trusted proxy
+    2. Separate adaptive concurrency limits for reads and writes -> 503;
+       their maxima together fit in THREADPOOL_SIZE (checked in Settings)
+    3. Both rejections carry Retry-After and never reach a handler
+    4. Latency is measured up to the response start, so long-lived
+       streaming responses do not hold a concurrency slot
+    5. LONG_RUNNING_PATHS (CSV import) take a slot but give no latency
+       feedback, so one long request does not shrink the limit
+    """
+
+    READ_METHODS = ("GET", "HEAD", "OPTIONS")
+    READ_PATHS = ("/api/v1/bookings/batch",)  # POST but read-only
+    EXEMPT_PATHS = ("/health",)
+    LONG_RUNNING_PATHS = ("/api/v1/bookings/import",)
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.rate_limiter = RateLimiter(
+            settings.RATE_LIMIT_PER_SECOND,
+            settings.RATE_LIMIT_BURST,
+            settings.RATE_LIMIT_MAX_CLIENTS,
+        )
+        self.read_limiter = AdaptiveConcurrencyLimiter(
+            settings.READ_CONCURRENCY_INITIAL,
+            settings.READ_CONCURRENCY_MIN,
+            settings.READ_CONCURRENCY_MAX,
+            settings.READ_TARGET_LATENCY_MS / 1000,
+        )
+        self.write_limiter = AdaptiveConcurrencyLimiter(
+            settings.WRITE_CONCURRENCY_INITIAL,
+            settings.WRITE_CONCURRENCY_MIN,
+            settings.WRITE_CONCURRENCY_MAX,
+            settings.WRITE_TARGET_LATENCY_MS / 1000,
+        )
+
+    @staticmethod
+    def client_key(request: Request) -> str:
+        return f"ip:{request.client.host if request.client else 'unknown'}"
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        if request.url.path in self.EXEMPT_PATHS:
+            return await call_next(request)
+
+        allowed, retry_after = self.rate_limiter.take(self.client_key(request))
+        if not allowed:
+            return _reject(429, "RATE_LIMITED", "Too many requests", retry_after)
+
+        is_read = request.method in self.READ_METHODS or request.url.path in self.READ_PATHS
+        limiter = self.read_limiter if is_read else self.write_limiter
+        seq = limiter.try_acquire()
+        if seq is None:
+            logger.warning(
+                f"Shedding {'read' if is_read else 'write'} request: "
+                f"inflight={limiter.inflight}, limit={limiter.limit:.1f}"
+            )
+            return _reject(503, "OVERLOADED", "Server is busy, retry later", 1)
+
+        timed = not request.url.path.startswith(self.LONG_RUNNING_PATHS)
+        started = time.monotonic()
+        overloaded = True
+        try:
+            response = await call_next(request)
+            overloaded = response.status_code == 503
+            return response
+        finally:
+            limiter.release(seq, time.monotonic() - started if timed else None, overloaded)
@@ -1,12 +1,22 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Literal, Optional
+import datetime as dt
 from datetime import date, time
-from email_validator import validate_email, EmailNotValidError
+from app.core.config import settings
+from app.services.recurrence import FREQ_DAYS
+from app.utils.validators import (
+    validate_email_address,
+    validate_future_date,
+    validate_business_hours,
+)
+
+PHONE_PATTERN = r"^\+?[1-9]\d{9}$"
+
 
 class Booking(BaseModel):
     customer_name: str = Field(..., min_length=2, max_length=100)
     customer_email: str = Field(..., max_length=255)
-    customer_phone: str = Field(..., max_length=15, pattern=r"^\+?[1-9]\d{9}$")
+    customer_phone: str = Field(..., max_length=15, pattern=PHONE_PATTERN)
     date: date
     time: time
     description: Optional[str] = Field(None, max_length=500)
@@ -14,22 +24,112 @@ class Booking(BaseModel):
 
     @field_validator("customer_email")
     def validate_email_field(cls, v):
-        try:
-            validate_email(v)
-        except EmailNotValidError:
-            raise ValueError("Invalid email format")
-        return v
+        return validate_email_address(v)
 
     @field_validator("date")
     def validate_future_date(cls, v):
-        if v < date.today():
-            raise ValueError("Date must be in the future")
-        return v
+        return validate_future_date(v)
 
     @field_validator("time")
     def validate_business_hours(cls, v):
-        if v.tzinfo is not None:
-            v = v.replace(tzinfo=None)
-        if v < time(8, 0) or v > time(20, 0):
-            raise ValueError("Time must be between 08:00 and 20:00")
+        return validate_business_hours(v)
+
+
+class BookingUpdate(BaseModel):
+    """
+    Partial booking update for PATCH.
+
+    Only fields present in the request body are validated and written;
+    use model_dump(exclude_unset=True) to get them.
+    """
+    customer_name: Optional[str] = Field(None, min_length=2, max_length=100)
+    customer_email: Optional[str] = Field(None, max_length=255)
+    customer_phone: Optional[str] = Field(None, max_length=15, pattern=PHONE_PATTERN)
+    # dt.* because the field names shadow the types in the class namespace
+    date: Optional[dt.date] = None
+    time: Optional[dt.time] = None
+    description: Optional[str] = Field(None, max_length=500)
+
+    @field_validator("customer_name", "customer_email", "customer_phone", "date", "time")
+    def reject_null(cls, v):
+        if v is None:
+            raise ValueError("Field cannot be null")
         return v
+
+    @field_validator("customer_email")
+    def validate_email_field(cls, v):
+        return validate_email_address(v)
+
+    @field_validator("date")
+    def validate_future_date(cls, v):
+        return validate_future_date(v)
+
+    @field_validator("time")
+    def validate_business_hours(cls, v):
+        return validate_business_hours(v)
+
+
+class BookingSeries(BaseModel):
+    """
+    Recurring booking (RRULE-style FREQ/INTERVAL with COUNT or UNTIL).
+
+    start_date is the first occurrence; exactly one of count/until bounds
+    the series.
+    """
+    customer_name: str = Field(..., min_length=2, max_length=100)
+    customer_email: str = Field(..., max_length=255)
+    customer_phone: str = Field(..., max_length=15, pattern=PHONE_PATTERN)
+    start_date: dt.date
+    time: dt.time
+    description: Optional[str] = Field(None, max_length=500)
+    freq: Literal["daily", "weekly"]
+    interval: int = Field(1, ge=1, le=52)
+    count: Optional[int] = Field(None, ge=1, le=settings.MAX_SERIES_OCCURRENCES)
+    until: Optional[dt.date] = None
+
+    @field_validator("customer_email")
+    def validate_email_field(cls, v):
+        return validate_email_address(v)
+
+    @field_validator("start_date")
+    def validate_future_date(cls, v):
+        return validate_future_date(v)
+
+    @field_validator("time")
+    def validate_business_hours(cls, v):
+        return validate_business_hours(v)
+
+    @model_validator(mode="after")
+    def validate_bounds(self):
+        if (self.count is None) == (self.until is None):
+            raise ValueError("Provide exactly one of count or until")
+        if self.until is not None:
+            if self.until < self.start_date:
+                raise ValueError("until must not be before start_date")
+            step = FREQ_DAYS[self.freq] * self.interval
+            occurrences = (self.until - self.start_date).days // step + 1
+            if occurrences > settings.MAX_SERIES_OCCURRENCES:
+                raise ValueError(
+                    f"Series cannot exceed {settings.MAX_SERIES_OCCURRENCES} occurrences"
+                )
+        return self
+
+
+class SlotHoldRequest(BaseModel):
+    date: dt.date
+    time: dt.time
+    ttl_seconds: int = Field(
+        settings.HOLD_TTL_SECONDS, ge=1, le=settings.HOLD_MAX_TTL_SECONDS
+    )
+
+    @field_validator("date")
+    def validate_future_date(cls, v):
+        return validate_future_date(v)
+
+    @field_validator("time")
+    def validate_business_hours(cls, v):
+        return validate_business_hours(v)
+
+
+class BookingBatchRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=settings.BATCH_MAX_IDS)
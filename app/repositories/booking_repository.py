@@ -0,0 +1,173 @@
+from datetime import date, time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.slot_service import ensure_slot_free
+from app.utils.database import BOOKING_COLUMNS, chunked, get_connection
+from app.utils.records import Record
+from app.utils.write_queue import run_write
+
+_COLUMN_LIST = ", ".join(BOOKING_COLUMNS)
+
+
+def _to_db(value: Any) -> Any:
+    if isinstance(value, (date, time)):
+        return str(value)
+    return value
+
+
+class BookingRepository:
+
+    UPDATABLE_FIELDS = (
+        "customer_name",
+        "customer_email",
+        "customer_phone",
+        "date",
+        "time",
+        "description",
+    )
+
+    def create(
+        self,
+        booking_data: Dict[str, Any],
+        hold_id: Optional[str] = None,
+    ) -> Record:
+        """
+        Insert a booking through the write queue and return the stored row.
+
+        The slot must not be held by anyone except `hold_id` (if given).
+        """
+        params = {f: _to_db(booking_data.get(f)) for f in self.UPDATABLE_FIELDS}
+
+        def insert(conn):
+            ensure_slot_free(conn, params["date"], params["time"], hold_id=hold_id)
+            return conn.execute("""
+                INSERT INTO bookings
+                (customer_name, customer_email, customer_phone, date, time, description)
+                VALUES (:customer_name, :customer_email, :customer_phone, :date, :time, :description)
+                RETURNING *
+            """, params).fetchone()
+
+        return run_write(insert)
+
+    def delete(self, booking_id: int) -> Optional[Record]:
+        """Delete a booking; returns the deleted row, or None if it did not exist."""
+        def remove(conn):
+            return conn.execute(
+                "DELETE FROM bookings WHERE id = ? RETURNING *", (booking_id,)
+            ).fetchone()
+
+        return run_write(remove)
+
+    def get_by_id(self, booking_id: int) -> Optional[Record]:
+        conn = get_connection()
+        try:
+            return conn.execute(
+                "SELECT * FROM bookings WHERE id = ?", (booking_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+    def get_many(
+        self,
+        booking_ids: List[int],
+        include_archived: bool = False,
+    ) -> Dict[int, Record]:
+        """
+        Fetch many bookings with chunked WHERE id IN (...) queries.
+
+        Returns {id: row} for the ids that exist; the archive is only
+        consulted for ids missing from the hot table.
+        """
+        unique_ids = list(dict.fromkeys(booking_ids))
+        found: Dict[int, Record] = {}
+
+        conn = get_connection()
+        try:
+            sources = ["bookings"]
+            if include_archived:
+                sources.append("bookings_archive")
+
+            for source in sources:
+                missing = [i for i in unique_ids if i not in found]
+                for chunk in chunked(missing):
+                    placeholders = ", ".join("?" * len(chunk))
+                    for row in conn.execute(
+                        f"SELECT {_COLUMN_LIST} FROM {source} WHERE id IN ({placeholders})",
+                        chunk,
+                    ):
+                        found[row["id"]] = row
+        finally:
+            conn.close()
+
+        return found
+
+    def update_with_version(
+        self,
+        booking_id: int,
+        update_data: Dict[str, Any],
+        expected_version: Optional[int] = None,
+        updated_by: str = "admin",
+    ) -> Optional[Tuple[Record, List[str]]]:
+        """
+        Conditionally update a booking and record its history.
+
+        The change set is computed by SQLite against the stored row, and the
+        update itself is a single UPDATE ... WHERE id AND version RETURNING *.
+        With expected_version=None the version check is skipped. Only the
+        columns in update_data are written, and when none of them differ
+        from the stored row nothing is written at all (no version bump, no
+        history entry).
+
+        Returns (updated_row, updated_fields), or None when no booking
+        matched the id/version pair.
+        """
+        fields = [f for f in self.UPDATABLE_FIELDS if f in update_data]
+        params = {f: _to_db(update_data[f]) for f in fields}
+        params.update(id=booking_id, version=expected_version, updated_by=updated_by)
+
+        guard = "id = :id AND (:version IS NULL OR version = :version)"
+        changes = " || ".join(
+            f"CASE WHEN {f} IS NOT :{f} THEN '{f}, ' ELSE '' END" for f in fields
+        ) or "''"
+        assignments = "".join(f"{f} = :{f}, " for f in fields)
+        changed = " OR ".join(f"{f} IS NOT :{f}" for f in fields) or "0"
+
+        moves_slot = "date" in params or "time" in params
+
+        def apply(conn):
+            if moves_slot:
+                current = conn.execute(
+                    f"SELECT date, time FROM bookings WHERE {guard}", params
+                ).fetchone()
+                if current:
+                    new_slot = (params.get("date", current["date"]), params.get("time", current["time"]))
+                    if new_slot != (current["date"], current["time"]):
+                        ensure_slot_free(conn, *new_slot)
+
+            history = conn.execute(f"""
+                INSERT INTO booking_history (booking_id, updated_fields, updated_by)
+                SELECT id, changes, :updated_by FROM (
+                    SELECT id, rtrim({changes}, ', ') AS changes
+                    FROM bookings WHERE {guard}
+                )
+                WHERE changes <> ''
+                RETURNING updated_fields
+            """, params).fetchone()
+
+            row = conn.execute(f"""
+                UPDATE bookings
+                SET {assignments}version = version + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE {guard} AND ({changed})
+                RETURNING *
+            """, params).fetchone()
+
+            if not row:
+                # Either a no-op update or no booking matched id/version
+                current = conn.execute(
+                    f"SELECT * FROM bookings WHERE {guard}", params
+                ).fetchone()
+                return (current, []) if current else None
+            updated_fields = history["updated_fields"].split(", ") if history else []
+            return row, updated_fields
+
+        return run_write(apply)
@@ -0,0 +1,72 @@
+import asyncio
+from datetime import date, timedelta
+from typing import Optional
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.utils.database import BOOKING_COLUMNS
+from app.utils.write_queue import run_write
+
+_COLUMN_LIST = ", ".join(BOOKING_COLUMNS)
+
+
+def archive_cutoff(today: Optional[date] = None) -> str:
+    today = today or date.today()
+    return str(today - timedelta(days=settings.ARCHIVE_AFTER_DAYS))
+
+
+def _archive_batch(cutoff: str, batch_size: int):
+    def move(conn):
+        ids = [
+            row[0] for row in conn.execute(
+                "SELECT id FROM bookings WHERE date < ? ORDER BY date LIMIT ?",
+                (cutoff, batch_size),
+            )
+        ]
+        if not ids:
+            return 0
+
+        placeholders = ", ".join("?" * len(ids))
+        conn.execute(f"""
+            INSERT INTO bookings_archive ({_COLUMN_LIST})
+            SELECT {_COLUMN_LIST} FROM bookings WHERE id IN ({placeholders})
+        """, ids)
+        conn.execute(f"DELETE FROM bookings WHERE id IN ({placeholders})", ids)
+        return len(ids)
+
+    return move
+
+
+def archive_past_bookings(
+    cutoff: Optional[str] = None,
+    batch_size: int = settings.ARCHIVE_BATCH_SIZE,
+) -> int:
+    """
+    Move bookings dated before the cutoff into bookings_archive.
+
+    Each batch is a separate write-queue operation, so archival interleaves
+    with regular bookings instead of holding the writer for the whole run.
+    Returns the number of bookings archived.
+    """
+    cutoff = cutoff or archive_cutoff()
+    total = 0
+
+    while True:
+        moved = run_write(_archive_batch(cutoff, batch_size))
+        total += moved
+        if moved < batch_size:
+            break
+
+    if total:
+        logger.info(f"Archived {total} bookings dated before {cutoff}")
+    return total
+
+
+async def run_archiver():
+    """Background task: archive past bookings every ARCHIVE_INTERVAL_SECONDS."""
+    while True:
+        try:
+            await asyncio.to_thread(archive_past_bookings)
+        except Exception as exc:
+            logger.error(f"Booking archival failed: {exc}")
+        await asyncio.sleep(settings.ARCHIVE_INTERVAL_SECONDS)
@@ -0,0 +1,123 @@
+import sqlite3
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Set
+
+from app.core.config import settings
+from app.services.recurrence import overlapping_series, series_occurrences
+from app.services.slot_holds import get_slot_holds
+from app.utils.validators import BUSINESS_CLOSE, BUSINESS_OPEN
+
+# Days of occupancy loaded per indexed range scan
+SCAN_WINDOW_DAYS = 7
+
+
+def _minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+BUSINESS_DAY_MINUTES = _minutes(BUSINESS_CLOSE) - _minutes(BUSINESS_OPEN)
+
+
+def _occupied_cells(
+    conn: sqlite3.Connection,
+    window_start: date,
+    window_end: date,
+    step: int,
+) -> Dict[str, Set[int]]:
+    """
+    Grid cells (index of the SLOT_MINUTES step after opening) taken per day.
+
+    Bookings come from a range scan of the UNIQUE(date, time) index in
+    (date, time) order; series occurrences and local holds are added on top.
+    A booking occupies [time, time + step), so an off-grid time blocks the
+    two cells it overlaps.
+    """
+    opening = _minutes(BUSINESS_OPEN)
+    occupied: Dict[str, Set[int]] = defaultdict(set)
+
+    def mark(slot_date: str, slot_time: str):
+        offset = _minutes(time.fromisoformat(slot_time)) - opening
+        cell, remainder = divmod(offset, step)
+        occupied[slot_date].add(cell)
+        if remainder:
+            occupied[slot_date].add(cell + 1)
+
+    for row in conn.execute(
+        "SELECT date, time FROM bookings WHERE date >= ? AND date <= ? ORDER BY date, time",
+        (str(window_start), str(window_end)),
+    ):
+        mark(row[0], row[1])
+
+    for series in overlapping_series(conn, window_start, window_end):
+        for day in series_occurrences(series, window_start, window_end):
+            mark(str(day), series["time"])
+
+    for slot_date, slot_time in get_slot_holds().held_slots(str(window_start), str(window_end)):
+        mark(slot_date, slot_time)
+
+    return occupied
+
+
+def find_free_slots(
+    conn: sqlite3.Connection,
+    after: datetime,
+    duration_minutes: Optional[int] = None,
+    limit: int = 5,
+    max_days: int = settings.NEXT_AVAILABLE_MAX_DAYS,
+) -> List[Dict[str, str]]:
+    """
+    The first `limit` free start times at or after `after`, within business hours.
+
+    Times are on a SLOT_MINUTES grid from BUSINESS_OPEN to BUSINESS_CLOSE.
+    A start is free when every cell its duration covers (rounded up to
+    whole steps, all of them bookable times) is free of bookings, series
+    occurrences and holds. Occupancy is loaded SCAN_WINDOW_DAYS at a time
+    and the search stops as soon as `limit` starts are found or
+    `max_days` days have been scanned.
+    """
+    step = settings.SLOT_MINUTES
+    cells_needed = max(1, -(-(duration_minutes or step) // step))
+    opening = _minutes(BUSINESS_OPEN)
+    cells_per_day = BUSINESS_DAY_MINUTES // step + 1
+
+    holds = get_slot_holds()
+    free: List[Dict[str, str]] = []
+    first_day = after.date()
+    last_day = first_day + timedelta(days=max_days - 1)
+    window_start = first_day
+
+    while window_start <= last_day and len(free) < limit:
+        window_end = min(window_start + timedelta(days=SCAN_WINDOW_DAYS - 1), last_day)
+        occupied = _occupied_cells(conn, window_start, window_end, step)
+
+        day = window_start
+        while day <= window_end and len(free) < limit:
+            slot_date = str(day)
+            busy = occupied.get(slot_date, ())
+            first_cell = 0
+            if day == first_day:
+                # Round `after` up to the next whole minute, then the next
+                # grid time, so a slot that has already started is skipped
+                after_minutes = _minutes(after.time()) + bool(after.second or after.microsecond)
+                first_cell = max(0, -(-(after_minutes - opening) // step))
+
+            run = 0  # free cells in a row ending at `cell`
+            for cell in range(first_cell, cells_per_day):
+                run = 0 if cell in busy else run + 1
+                if run < cells_needed:
+                    continue
+                start = cell - cells_needed + 1
+                starts = [opening + (start + i) * step for i in range(cells_needed)]
+                times = [f"{m // 60:02d}:{m % 60:02d}:00" for m in starts]
+                # Also catches holds made on other nodes
+                if any(holds.is_held(slot_date, t) for t in times):
+                    continue
+                free.append({"date": slot_date, "time": times[0]})
+                if len(free) == limit:
+                    break
+            day += timedelta(days=1)
+
+        window_start = window_end + timedelta(days=1)
+
+    return free
@@ -1,44 +1,117 @@
-from fastapi import HTTPException
+from typing import Optional
+
+from fastapi import HTTPException, status
+from app.core.response import error_response
 from app.repositories.booking_repository import BookingRepository
-from app.models.booking import BookingUpdate
+from app.models.booking import Booking, BookingUpdate
+from app.services.slot_holds import get_slot_holds
+from app.services.change_feed import get_change_feed
 
 
 class BookingService:
     def __init__(self):
         self.repository = BookingRepository()
 
+    def create_booking(self, booking: Booking):
+        row = self.repository.create(booking.model_dump(exclude={"version"}))
+        get_change_feed().publish("created", row)
+        return row
+
+    def delete_booking(self, booking_id: int):
+        row = self.repository.delete(booking_id)
+        if row:
+            get_change_feed().publish("deleted", row)
+        return row
+
+    def confirm_hold(self, hold_id: str, booking: Booking):
+        """Turn a live slot hold into a booking for the same slot."""
+        holds = get_slot_holds()
+        hold = holds.claim(hold_id)
+
+        if not hold:
+            raise HTTPException(status_code=404, detail="Slot hold not found or expired")
+
+        if (hold.date, hold.time) != (str(booking.date), str(booking.time)):
+            holds.unclaim(hold_id)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=error_response(
+                    code="HOLD_SLOT_MISMATCH",
+                    message="Booking date/time must match the held slot",
+                    details={"date": hold.date, "time": hold.time}
+                )
+            )
+
+        try:
+            row = self.repository.create(
+                booking.model_dump(exclude={"version"}), hold_id=hold_id
+            )
+        except Exception:
+            holds.unclaim(hold_id)
+            raise
+
+        holds.release(hold_id)
+        get_change_feed().publish("created", row)
+        return row
+
     def update_booking(
+        self,
+        booking_id: int,
+        update_data: Booking,
+        expected_version: Optional[int] = None
+    ):
+        return self._update(
+            booking_id,
+            update_data.model_dump(exclude={"version"}),
+            expected_version
+        )
+
+    def patch_booking(
         self,
         booking_id: int,
         update_data: BookingUpdate,
-        expected_version: int
+        expected_version: Optional[int] = None
+    ):
+        # Only the fields the client actually sent
+        return self._update(
+            booking_id,
+            update_data.model_dump(exclude_unset=True),
+            expected_version
+        )
+
+    def _update(
+        self,
+        booking_id: int,
+        fields: dict,
+        expected_version: Optional[int]
     ):
-        # Fetch current booking
+        # Optimistic locking happens inside the UPDATE itself
+        result = self.repository.update_with_version(
+            booking_id=booking_id,
+            update_data=fields,
+            expected_version=expected_version
+        )
+
+        if result:
+            row, updated_fields = result
+            if updated_fields:
+                get_change_feed().publish("updated", row)
+            return result
+
+        # Nothing matched: find out whether the booking is gone or just stale
         current_booking = self.repository.get_by_id(booking_id)
 
         if not current_booking:
             raise HTTPException(status_code=404, detail="Booking not found")
 
-        if getattr(current_booking, "deleted_at", None) is not None:
-            raise HTTPException(status_code=404, detail="Booking was deleted")
-
-        # Optimistic locking
-        if current_booking.version != expected_version:
-            raise HTTPException(
-                status_code=409,
-                detail={
-                    "code": "OPTIMISTIC_LOCK_FAILURE",
-                    "message": "Booking was modified by another process",
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=error_response(
+                code="OPTIMISTIC_LOCK_FAILURE",
+                message="Booking was modified by another process",
+                details={
                     "expected_version": expected_version,
-                    "current_version": current_booking.version
+                    "current_version": current_booking["version"]
                 }
             )
-
-        updated_booking = self.repository.update_with_version(
-            booking_id=booking_id,
-            update_data=update_data,
-            current_version=expected_version,
-            new_version=expected_version + 1
         )
-
-        return updated_booking
@@ -0,0 +1,236 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional, Set
+from uuid import uuid4
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.core.response import json_default
+
+# Queued to a subscriber that fell too far behind; the stream then closes
+DISCONNECT = {"type": "disconnect", "reason": "slow_consumer"}
+
+
+class Subscriber:
+    __slots__ = ("queue", "date_from", "date_to", "last_seq")
+
+    def __init__(self, buffer_size: int, date_from: Optional[str], date_to: Optional[str]):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.date_from = date_from
+        self.date_to = date_to
+        self.last_seq = 0
+
+    def wants(self, event: Dict[str, Any]) -> bool:
+        if event["seq"] <= self.last_seq:
+            return False
+        if event["type"] == "reset":
+            # Bulk changes carry the date range they touched
+            if self.date_from and event.get("date_to") and event["date_to"] < self.date_from:
+                return False
+            if self.date_to and event.get("date_from") and event["date_from"] > self.date_to:
+                return False
+            return True
+        event_date = event.get("date")
+        if event_date is None:
+            return True
+        if self.date_from and event_date < self.date_from:
+            return False
+        if self.date_to and event_date > self.date_to:
+            return False
+        return True
+
+
+class ChangeFeed:
+    """
+    In-process pub/sub of booking changes, replacing list polling.
+
+    Implementation Notes:
+    - publish() is called from sync handlers (threadpool threads) after
+      the write has committed; sequence numbers are assigned under a lock
+      and fan-out is handed to the event loop in the same order
+    - The last CHANGE_FEED_HISTORY events are kept so clients can resume
+      from an event id "<origin>:<seq>" (SSE Last-Event-ID). Sequence
+      numbers only mean something in this process, so an id from another
+      origin (restart, another worker), one ahead of the feed, one older
+      than the history or a backlog larger than the subscriber buffer all
+      get a "reset" event telling the client to re-sync with a normal GET;
+      the stream then continues live with ids the client can resume from
+    - Every subscriber has a bounded queue; one that overflows is
+      disconnected rather than buffering without limit
+    - With CHANGE_FEED_REDIS_ENABLED events are also published to a Redis
+      channel and events from other workers are re-sequenced locally
+    """
+
+    def __init__(
+        self,
+        history_size: int = settings.CHANGE_FEED_HISTORY,
+        buffer_size: int = settings.CHANGE_FEED_BUFFER,
+    ):
+        self.buffer_size = buffer_size
+        self.origin = uuid4().hex
+        self._seq = 0
+        self._history: deque = deque(maxlen=history_size)
+        self._subscribers: Set[Subscriber] = set()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis = None
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    # ---------------- Publishing ----------------
+
+    def publish(self, event_type: str, booking: Dict[str, Any]):
+        """Publish a committed change (safe to call from any thread)."""
+        payload = {
+            "type": event_type,
+            "booking_id": booking.get("id"),
+            "date": booking.get("date"),
+            "booking": booking,
+        }
+        self._broadcast(payload)
+
+    def publish_reset(self, reason: str, date_from: str, date_to: str, **details: Any):
+        """
+        Publish a change too large for per-booking events (e.g. a CSV
+        import): subscribers whose date filter overlaps date_from..date_to
+        get a "reset" and re-sync with a normal GET.
+        """
+        self._broadcast({
+            "type": "reset",
+            "reason": reason,
+            "date_from": date_from,
+            "date_to": date_to,
+            **details,
+        })
+
+    def _broadcast(self, payload: Dict[str, Any]):
+        self._record(payload)
+
+        if settings.CHANGE_FEED_REDIS_ENABLED:
+            try:
+                self._redis_client().publish(
+                    settings.CHANGE_FEED_REDIS_CHANNEL,
+                    json.dumps({**payload, "origin": self.origin}, default=json_default),
+                )
+            except Exception as exc:
+                logger.error(f"Change feed Redis publish failed: {exc}")
+
+    def _record(self, payload: Dict[str, Any]):
+        with self._lock:
+            self._seq += 1
+            event = {"seq": self._seq, "ts": time.time(), **payload}
+            self._history.append(event)
+            # Scheduled under the lock so fan-out order matches seq order
+            if self._loop and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._fan_out, event)
+
+    def _fan_out(self, event: Dict[str, Any]):
+        for subscriber in list(self._subscribers):
+            if not subscriber.wants(event):
+                continue
+            try:
+                subscriber.queue.put_nowait(event)
+                subscriber.last_seq = event["seq"]
+            except asyncio.QueueFull:
+                logger.warning("Disconnecting slow change feed subscriber")
+                self._subscribers.discard(subscriber)
+                while not subscriber.queue.empty():
+                    subscriber.queue.get_nowait()
+                subscriber.queue.put_nowait(DISCONNECT)
+
+    # ---------------- Subscribing (event loop only) ----------------
+
+    def event_id(self, event: Dict[str, Any]) -> str:
+        """SSE id of an event; only meaningful to this feed instance."""
+        return f"{self.origin}:{event['seq']}"
+
+    def subscribe(
+        self,
+        since: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> Subscriber:
+        """
+        Register a subscriber; `since` is the event id to resume after.
+
+        Without `since` the subscriber starts live. Otherwise the retained
+        events after it are replayed, or a single reset event is queued
+        (see the class notes) and the subscriber starts live.
+        """
+        subscriber = Subscriber(self.buffer_size, date_from, date_to)
+
+        with self._lock:
+            history = list(self._history)
+            current_seq = self._seq
+
+        reason = None
+        if since is not None:
+            resume_seq = self._resume_seq(since, current_seq)
+            oldest = history[0]["seq"] if history else current_seq + 1
+            if resume_seq is None:
+                reason = "unknown_event_id"
+            elif resume_seq < oldest - 1:
+                reason = "history_truncated"
+            else:
+                subscriber.last_seq = resume_seq
+                backlog = [event for event in history if subscriber.wants(event)]
+                if len(backlog) > subscriber.queue.maxsize:
+                    reason = "backlog_too_large"
+                else:
+                    for event in backlog:
+                        subscriber.queue.put_nowait(event)
+
+        subscriber.last_seq = current_seq
+        if reason:
+            subscriber.queue.put_nowait({"seq": current_seq, "type": "reset", "reason": reason})
+
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def _resume_seq(self, event_id: str, current_seq: int) -> Optional[int]:
+        origin, _, seq = event_id.rpartition(":")
+        if origin != self.origin or not seq.isdigit() or int(seq) > current_seq:
+            return None
+        return int(seq)
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self._subscribers.discard(subscriber)
+
+    # ---------------- Redis (cross-worker) ----------------
+
+    def _redis_client(self):
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis.from_url(settings.REDIS_URL)
+        return self._redis
+
+    async def listen_redis(self):
+        """Background task: relay other workers' events to local subscribers."""
+        import redis.asyncio as aioredis
+
+        client = aioredis.Redis.from_url(settings.REDIS_URL)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(settings.CHANGE_FEED_REDIS_CHANNEL)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                payload = json.loads(message["data"])
+                if payload.pop("origin", None) == self.origin:
+                    continue
+                self._record(payload)
+        finally:
+            await pubsub.close()
+            await client.close()
+
+
+_change_feed = ChangeFeed()
+
+
+def get_change_feed() -> ChangeFeed:
+    return _change_feed
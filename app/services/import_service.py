@@ -0,0 +1,240 @@
+import csv
+import io
+import multiprocessing
+import os
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, BinaryIO, Deque, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.models.booking import Booking
+from app.services.change_feed import get_change_feed
+from app.services.slot_service import ensure_slot_free
+from app.utils.database import is_slot_conflict
+from app.utils.write_queue import run_write
+
+CSV_FIELDS = ("customer_name", "customer_email", "customer_phone", "date", "time", "description")
+REQUIRED_FIELDS = CSV_FIELDS[:5]
+
+RawRow = Tuple[int, Dict[str, Optional[str]]]  # (line number, CSV values)
+ValidRow = Tuple[int, str, str, str, str, str, Optional[str]]  # line number + insert params
+RowError = Tuple[int, str]
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _worker_count() -> int:
+    return settings.IMPORT_WORKERS or os.cpu_count() or 1
+
+
+def get_import_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the server process has running threads
+            _pool = ProcessPoolExecutor(
+                max_workers=_worker_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_import_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+# ---------------- Worker side ----------------
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+def validate_chunk(rows: List[RawRow]) -> Tuple[List[ValidRow], List[RowError]]:
+    """
+    Validate CSV rows with the Booking model (runs in a pool worker).
+
+    Returns the valid rows as ready-to-insert tuples and the errors as
+    (line, message); both are small to pickle back to the server.
+    """
+    valid: List[ValidRow] = []
+    errors: List[RowError] = []
+    for line, values in rows:
+        # Empty cells count as missing
+        data = {f: v.strip() for f in CSV_FIELDS if (v := values.get(f)) and v.strip()}
+        try:
+            booking = Booking.model_validate(data)
+        except ValidationError as exc:
+            errors.append((line, _describe(exc)))
+            continue
+        valid.append((
+            line,
+            booking.customer_name,
+            booking.customer_email,
+            booking.customer_phone,
+            str(booking.date),
+            str(booking.time),
+            booking.description,
+        ))
+    return valid, errors
+
+
+# ---------------- Server side ----------------
+
+def _insert_chunk(rows: List[ValidRow]):
+    def insert(conn):
+        inserted: List[str] = []  # dates of the inserted rows
+        errors: List[RowError] = []
+        for line, *params in rows:
+            # A failed INSERT only undoes itself; the rest of the chunk goes on
+            try:
+                ensure_slot_free(conn, params[3], params[4])
+                conn.execute("""
+                    INSERT INTO bookings
+                    (customer_name, customer_email, customer_phone, date, time, description)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, params)
+                inserted.append(params[3])
+            except sqlite3.IntegrityError as exc:
+                errors.append((
+                    line,
+                    "Selected time slot already booked" if is_slot_conflict(exc)
+                    else "This email ID is already reserved",
+                ))
+        return inserted, errors
+
+    return insert
+
+
+class ImportReport:
+    def __init__(self, max_errors: int = settings.IMPORT_MAX_ERRORS):
+        self.max_errors = max_errors
+        self.total_rows = 0
+        self.imported = 0
+        self.rejected = 0
+        self.first_date: Optional[str] = None
+        self.last_date: Optional[str] = None
+        self.errors: List[RowError] = []
+        self.aborted: Optional[str] = None
+
+    def add_imported(self, dates: List[str]):
+        if not dates:
+            return
+        self.imported += len(dates)
+        first, last = min(dates), max(dates)
+        self.first_date = min(self.first_date or first, first)
+        self.last_date = max(self.last_date or last, last)
+
+    def add_errors(self, errors: List[RowError]):
+        self.rejected += len(errors)
+        room = self.max_errors - len(self.errors)
+        if room > 0:
+            self.errors.extend(errors[:room])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_rows": self.total_rows,
+            "imported": self.imported,
+            "rejected": self.rejected,
+            "completed": self.aborted is None,
+            "aborted_reason": self.aborted,
+            "errors": [{"line": line, "error": message} for line, message in sorted(self.errors)],
+            "errors_truncated": self.rejected > len(self.errors),
+        }
+
+
+def import_bookings_csv(stream: BinaryIO) -> Dict[str, Any]:
+    """
+    Import bookings from a CSV byte stream and return a per-row error report.
+
+    Implementation Notes:
+    - The stream is decoded and parsed incrementally; only the current
+      chunk and the chunks in flight are held in memory
+    - Chunks of IMPORT_CHUNK_SIZE rows are validated in a process pool
+      (the Booking validators are CPU bound), with at most
+      IMPORT_MAX_INFLIGHT_CHUNKS outstanding, so a fast upload cannot
+      queue the whole file
+    - Results are consumed in submission order; each chunk's valid rows
+      are inserted by one write-queue operation, and a row that conflicts
+      (slot or email) is reported without failing the chunk
+    - The error list is capped at IMPORT_MAX_ERRORS; counts stay exact
+    - The change feed gets one "reset" event (reason "bulk_import") with
+      the imported date range instead of an event per row
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        try:
+            header = reader.fieldnames or []
+        except (csv.Error, UnicodeDecodeError) as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unreadable CSV: {exc}")
+
+        missing = [f for f in REQUIRED_FIELDS if f not in header]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"CSV is missing columns: {', '.join(missing)}. Expected: {', '.join(CSV_FIELDS)}"
+            )
+
+        pool = get_import_pool()
+        max_inflight = settings.IMPORT_MAX_INFLIGHT_CHUNKS or 2 * _worker_count()
+        pending: Deque[Future] = deque()
+        report = ImportReport()
+
+        def finish_oldest():
+            valid, errors = pending.popleft().result()
+            report.add_errors(errors)
+            if valid:
+                inserted, conflicts = run_write(_insert_chunk(valid))
+                report.add_imported(inserted)
+                report.add_errors(conflicts)
+
+        def submit(chunk: List[RawRow]):
+            while len(pending) >= max_inflight:
+                finish_oldest()
+            pending.append(pool.submit(validate_chunk, chunk))
+            report.total_rows += len(chunk)
+
+        try:
+            chunk: List[RawRow] = []
+            try:
+                for values in reader:
+                    chunk.append((reader.line_num, values))
+                    if len(chunk) >= settings.IMPORT_CHUNK_SIZE:
+                        submit(chunk)
+                        chunk = []
+            except (csv.Error, UnicodeDecodeError) as exc:
+                # Keep what was read so far; report where parsing stopped
+                report.aborted = f"Unreadable CSV after line {reader.line_num}: {exc}"
+            if chunk:
+                submit(chunk)
+            while pending:
+                finish_oldest()
+        finally:
+            for future in pending:
+                future.cancel()
+    finally:
+        # The UploadFile owns the underlying file
+        text.detach()
+
+    if report.imported:
+        get_change_feed().publish_reset(
+            "bulk_import", report.first_date, report.last_date, imported=report.imported
+        )
+    logger.info(
+        f"CSV import: {report.total_rows} rows, {report.imported} imported, {report.rejected} rejected"
+    )
+    return report.to_dict()
@@ -0,0 +1,119 @@
+import sqlite3
+from datetime import date, timedelta
+from typing import Iterable, Iterator, List, Optional
+
+from app.utils.database import chunked
+
+FREQ_DAYS = {"daily": 1, "weekly": 7}
+
+
+def _as_date(value) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def last_occurrence(
+    start: date,
+    freq: str,
+    interval: int = 1,
+    count: Optional[int] = None,
+    until: Optional[date] = None,
+) -> date:
+    """Date of the final occurrence for a count- or until-bounded series."""
+    step = FREQ_DAYS[freq] * interval
+    if count is not None:
+        return start + timedelta(days=step * (count - 1))
+    return start + timedelta(days=step * ((until - start).days // step))
+
+
+def iter_occurrences(
+    start: date,
+    end: date,
+    freq: str,
+    interval: int = 1,
+    window_start: Optional[date] = None,
+    window_end: Optional[date] = None,
+) -> Iterator[date]:
+    """
+    Lazily yield occurrence dates, limited to [window_start, window_end].
+
+    Jumps straight to the first occurrence inside the window, so the cost
+    is proportional to the occurrences returned, not the series length.
+    """
+    step = FREQ_DAYS[freq] * interval
+    last = min(end, window_end) if window_end else end
+
+    current = start
+    if window_start and window_start > start:
+        skipped = -(-(window_start - start).days // step)  # ceil division
+        current = start + timedelta(days=step * skipped)
+
+    while current <= last:
+        yield current
+        current += timedelta(days=step)
+
+
+def series_occurrences(
+    series,
+    window_start: Optional[date] = None,
+    window_end: Optional[date] = None,
+) -> Iterator[date]:
+    """iter_occurrences() for a booking_series row."""
+    return iter_occurrences(
+        _as_date(series["start_date"]),
+        _as_date(series["end_date"]),
+        series["freq"],
+        series["interval"],
+        window_start,
+        window_end,
+    )
+
+
+def overlapping_series(
+    conn: sqlite3.Connection,
+    window_start: date,
+    window_end: date,
+    time: Optional[str] = None,
+) -> List[sqlite3.Row]:
+    """Series with at least one day inside the window (optionally at one time)."""
+    query = "SELECT * FROM booking_series WHERE start_date <= ? AND end_date >= ?"
+    params: list = [str(window_end), str(window_start)]
+    if time is not None:
+        query += " AND time = ?"
+        params.append(time)
+    return conn.execute(query, params).fetchall()
+
+
+def series_conflicts(
+    conn: sqlite3.Connection, time: str, dates: List[date]
+) -> List[str]:
+    """Dates among `dates` already taken at `time` by an existing series."""
+    if not dates:
+        return []
+    wanted = set(dates)
+    conflicts = set()
+    for series in overlapping_series(conn, min(dates), max(dates), time):
+        conflicts.update(
+            d for d in series_occurrences(series, min(dates), max(dates)) if d in wanted
+        )
+    return sorted(str(d) for d in conflicts)
+
+
+def booking_conflicts(
+    conn: sqlite3.Connection, time: str, dates: Iterable[date]
+) -> List[str]:
+    """
+    Dates among `dates` already booked at `time`.
+
+    One IN (...) query per chunk of dates, each resolved through the
+    UNIQUE(date, time) index.
+    """
+    conflicts = []
+    for chunk in chunked([str(d) for d in dates]):
+        placeholders = ", ".join("?" * len(chunk))
+        conflicts.extend(
+            row[0] for row in conn.execute(
+                f"SELECT date FROM bookings WHERE time = ? AND date IN ({placeholders})",
+                (time, *chunk),
+            )
+        )
+    return sorted(conflicts)
@@ -0,0 +1,321 @@
+import asyncio
+import heapq
+import threading
+import time as clock
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.utils.database import SlotConflictError
+
+Slot = Tuple[str, str]  # (date, time) as stored in bookings
+
+
+class SlotHold:
+    __slots__ = ("hold_id", "date", "time", "deadline", "expires_at", "claimed")
+
+    def __init__(self, hold_id: str, date: str, time: str, ttl_seconds: int):
+        self.hold_id = hold_id
+        self.date = date
+        self.time = time
+        self.deadline = clock.monotonic() + ttl_seconds
+        self.expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
+        self.claimed = False
+
+    def to_dict(self):
+        return {
+            "hold_id": self.hold_id,
+            "date": self.date,
+            "time": self.time,
+            "expires_at": self.expires_at.isoformat() + "Z",
+        }
+
+
+class SlotHoldManager:
+    """
+    In-memory temporary holds on (date, time) slots.
+
+    Implementation Notes:
+    - Holds live in a dict keyed by id plus a (date, time) index
+    - Expiry uses one min-heap of (deadline, hold_id) instead of a timer
+      per hold; expired entries are popped lazily on every call and by a
+      periodic sweeper, so each operation is O(log n)
+    - Released holds leave stale heap entries that are skipped when popped
+    - A claimed hold (being converted into a booking) does not expire
+      locally; its Redis keys get HOLD_CONFIRM_TIMEOUT_SECONDS instead of
+      losing their TTL, so a process dying mid-confirm cannot hold the slot
+      on every node forever
+    - With HOLDS_REDIS_ENABLED each hold is also stored in Redis with the
+      same TTL: a slot key (SET NX PX) that blocks the slot on every node,
+      and a hold record (date, time, expires_at, claimed) so any node can
+      confirm or release it. Claim, unclaim and release run as Lua scripts,
+      so two nodes cannot both convert the same hold
+    """
+
+    def __init__(self, use_redis: bool = settings.HOLDS_REDIS_ENABLED):
+        self._holds: Dict[str, SlotHold] = {}
+        self._by_slot: Dict[Slot, str] = {}
+        self._expiry: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._use_redis = use_redis
+        self._redis = None
+
+    # ---------------- Public API ----------------
+
+    def create(self, date: str, time: str, ttl_seconds: int) -> SlotHold:
+        """Hold a slot; raises SlotConflictError if it is already held."""
+        hold = SlotHold(uuid4().hex, date, time, ttl_seconds)
+
+        with self._lock:
+            self._purge_expired()
+            if (date, time) in self._by_slot:
+                raise SlotConflictError(f"Slot {date} {time} is temporarily held")
+            self._holds[hold.hold_id] = hold
+            self._by_slot[(date, time)] = hold.hold_id
+            heapq.heappush(self._expiry, (hold.deadline, hold.hold_id))
+
+        # Outside the lock: a Redis round trip must not stall every other hold call
+        if self._use_redis and not self._redis_create(hold, ttl_seconds):
+            with self._lock:
+                self._remove(hold.hold_id)
+            raise SlotConflictError(f"Slot {date} {time} is temporarily held")
+        return hold
+
+    def get(self, hold_id: str) -> Optional[SlotHold]:
+        with self._lock:
+            self._purge_expired()
+            hold = self._holds.get(hold_id)
+        if hold is None and self._use_redis:
+            return self._redis_get(hold_id)
+        return hold
+
+    def is_held(self, date: str, time: str, exclude: Optional[str] = None) -> bool:
+        """True if the slot is held by any hold other than `exclude`."""
+        with self._lock:
+            self._purge_expired()
+            holder = self._by_slot.get((date, time))
+        if holder is not None:
+            return holder != exclude
+        if self._use_redis:
+            holder = self._redis_client().get(self._redis_key(date, time))
+            return holder is not None and holder != exclude
+        return False
+
+    def claim(self, hold_id: str) -> Optional[SlotHold]:
+        """Pin a live hold while it is converted into a booking."""
+        with self._lock:
+            self._purge_expired()
+            hold = self._holds.get(hold_id)
+            if hold is not None:
+                if hold.claimed:
+                    return None
+                hold.claimed = True
+        if not self._use_redis:
+            return hold
+
+        # Redis decides, so a hold made on another node can be confirmed here
+        claimed = self._redis_claim(hold_id, hold)
+        if claimed is None and hold is not None:
+            self._unclaim_local(hold_id)
+        return claimed
+
+    def unclaim(self, hold_id: str):
+        """Return a claimed hold to normal expiry (conversion failed)."""
+        hold = self._unclaim_local(hold_id)
+        if self._use_redis:
+            self._redis_unclaim(hold_id, hold)
+
+    def release(self, hold_id: str) -> bool:
+        with self._lock:
+            hold = self._remove(hold_id)
+        if self._use_redis:
+            return self._redis_release(hold_id, hold) or hold is not None
+        return hold is not None
+
+    def held_slots(self, date_from: str, date_to: str) -> List[Slot]:
+        """Held (date, time) slots with date_from <= date <= date_to."""
+        with self._lock:
+            self._purge_expired()
+            slots = [slot for slot in self._by_slot if date_from <= slot[0] <= date_to]
+        # Holds made on other nodes (Redis) are only visible through is_held()
+        return slots
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self._purge_expired()
+
+    def __len__(self):
+        return len(self._holds)
+
+    def _unclaim_local(self, hold_id: str) -> Optional[SlotHold]:
+        with self._lock:
+            hold = self._holds.get(hold_id)
+            if hold is not None:
+                hold.claimed = False
+                heapq.heappush(self._expiry, (hold.deadline, hold_id))
+        return hold
+
+    # ---------------- Internals (call with the lock held) ----------------
+
+    def _remove(self, hold_id: str) -> Optional[SlotHold]:
+        hold = self._holds.pop(hold_id, None)
+        if hold:
+            self._by_slot.pop((hold.date, hold.time), None)
+        return hold
+
+    def _purge_expired(self) -> int:
+        now = clock.monotonic()
+        expired = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            deadline, hold_id = heapq.heappop(self._expiry)
+            hold = self._holds.get(hold_id)
+            # Stale entry: released, or re-pushed after an unclaim
+            if hold is None or hold.claimed or hold.deadline != deadline:
+                continue
+            self._remove(hold_id)
+            expired += 1
+        # Redis keys expire on their own via PX
+        return expired
+
+    # ---------------- Redis ----------------
+
+    @staticmethod
+    def _redis_key(date: str, time: str) -> str:
+        return f"hold:{date}:{time}"
+
+    @staticmethod
+    def _redis_record_key(hold_id: str) -> str:
+        return f"holdrec:{hold_id}"
+
+    def _redis_client(self):
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self._redis
+
+    def _redis_slot_key(self, hold_id: str, hold: Optional[SlotHold]) -> Optional[str]:
+        """Slot key of a hold, read from its Redis record if it was made on another node."""
+        if hold is not None:
+            return self._redis_key(hold.date, hold.time)
+        date, time = self._redis_client().hmget(self._redis_record_key(hold_id), "date", "time")
+        return self._redis_key(date, time) if date else None
+
+    def _redis_create(self, hold: SlotHold, ttl_seconds: int) -> bool:
+        expires_at_ms = int(hold.expires_at.replace(tzinfo=timezone.utc).timestamp() * 1000)
+        return bool(self._redis_client().eval(
+            _CREATE_SCRIPT, 2,
+            self._redis_key(hold.date, hold.time), self._redis_record_key(hold.hold_id),
+            hold.hold_id, ttl_seconds * 1000, hold.date, hold.time, expires_at_ms,
+        ))
+
+    def _redis_get(self, hold_id: str) -> Optional[SlotHold]:
+        record = self._redis_client().hgetall(self._redis_record_key(hold_id))
+        if not record:
+            return None
+        hold = _remote_hold(hold_id, record["date"], record["time"], record["expires_at"])
+        hold.claimed = record["claimed"] == "1"
+        return hold
+
+    def _redis_claim(self, hold_id: str, hold: Optional[SlotHold]) -> Optional[SlotHold]:
+        slot_key = self._redis_slot_key(hold_id, hold)
+        if slot_key is None:
+            return None
+        record = self._redis_client().eval(
+            _CLAIM_SCRIPT, 2, self._redis_record_key(hold_id), slot_key,
+            hold_id, settings.HOLD_CONFIRM_TIMEOUT_SECONDS * 1000,
+        )
+        if record is None:
+            return None
+        if hold is None:
+            hold = _remote_hold(hold_id, *record)
+            hold.claimed = True
+        return hold
+
+    def _redis_unclaim(self, hold_id: str, hold: Optional[SlotHold]):
+        slot_key = self._redis_slot_key(hold_id, hold)
+        if slot_key is not None:
+            self._redis_client().eval(
+                _UNCLAIM_SCRIPT, 2, self._redis_record_key(hold_id), slot_key,
+                hold_id, int(clock.time() * 1000),
+            )
+
+    def _redis_release(self, hold_id: str, hold: Optional[SlotHold]) -> bool:
+        slot_key = self._redis_slot_key(hold_id, hold)
+        if slot_key is None:
+            return False
+        return bool(self._redis_client().eval(
+            _RELEASE_SCRIPT, 2, self._redis_record_key(hold_id), slot_key, hold_id
+        ))
+
+
+def _remote_hold(hold_id: str, date: str, time: str, expires_at_ms) -> SlotHold:
+    """SlotHold for a Redis record, with the TTL it has left."""
+    remaining = max(int(expires_at_ms) / 1000 - clock.time(), 0)
+    return SlotHold(hold_id, date, time, remaining)
+
+
+# KEYS: slot key, record key. ARGV: hold_id, ttl ms, date, time, expires_at ms
+_CREATE_SCRIPT = """
+if not redis.call("set", KEYS[1], ARGV[1], "NX", "PX", ARGV[2]) then
+    return 0
+end
+redis.call("hset", KEYS[2], "date", ARGV[3], "time", ARGV[4], "expires_at", ARGV[5], "claimed", 0)
+redis.call("pexpire", KEYS[2], ARGV[2])
+return 1
+"""
+
+# KEYS: record key, slot key. ARGV: hold_id, confirm timeout ms
+_CLAIM_SCRIPT = """
+if redis.call("hget", KEYS[1], "claimed") ~= "0" then
+    return nil
+end
+redis.call("hset", KEYS[1], "claimed", 1)
+redis.call("pexpire", KEYS[1], ARGV[2])
+if redis.call("get", KEYS[2]) == ARGV[1] then
+    redis.call("pexpire", KEYS[2], ARGV[2])
+end
+return redis.call("hmget", KEYS[1], "date", "time", "expires_at")
+"""
+
+# KEYS: record key, slot key. ARGV: hold_id, now ms
+_UNCLAIM_SCRIPT = """
+local expires_at = redis.call("hget", KEYS[1], "expires_at")
+if not expires_at then
+    return 0
+end
+local remaining = math.max(tonumber(expires_at) - tonumber(ARGV[2]), 1)
+redis.call("hset", KEYS[1], "claimed", 0)
+redis.call("pexpire", KEYS[1], remaining)
+if redis.call("get", KEYS[2]) == ARGV[1] then
+    redis.call("pexpire", KEYS[2], remaining)
+end
+return 1
+"""
+
+# KEYS: record key, slot key. ARGV: hold_id. Deletes the slot key only if this hold owns it.
+_RELEASE_SCRIPT = """
+local existed = redis.call("del", KEYS[1])
+if redis.call("get", KEYS[2]) == ARGV[1] then
+    redis.call("del", KEYS[2])
+end
+return existed
+"""
+
+
+_slot_holds = SlotHoldManager()
+
+
+def get_slot_holds() -> SlotHoldManager:
+    return _slot_holds
+
+
+async def run_hold_sweeper():
+    """Background task: drop expired holds even when no requests arrive."""
+    while True:
+        await asyncio.sleep(settings.HOLD_SWEEP_SECONDS)
+        expired = _slot_holds.purge_expired()
+        if expired:
+            logger.debug(f"Expired {expired} slot holds")
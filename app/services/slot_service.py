@@ -0,0 +1,41 @@
+import sqlite3
+from datetime import date
+from typing import Optional
+
+from app.services.recurrence import overlapping_series, series_occurrences
+from app.services.slot_holds import get_slot_holds
+from app.utils.database import SlotConflictError
+
+
+def ensure_slot_free(
+    conn: sqlite3.Connection,
+    slot_date: str,
+    slot_time: str,
+    hold_id: Optional[str] = None,
+):
+    """
+    Raise SlotConflictError if the slot is taken by a recurring series or
+    held by a slot hold other than `hold_id`.
+
+    Conflicts with other bookings rows are left to the UNIQUE(date, time)
+    constraint. Must run on the writer connection, inside the same write
+    operation as the insert/update it guards.
+    """
+    if get_slot_holds().is_held(slot_date, slot_time, exclude=hold_id):
+        raise SlotConflictError(f"Slot {slot_date} {slot_time} is temporarily held")
+
+    day = date.fromisoformat(slot_date)
+    for series in overlapping_series(conn, day, day, slot_time):
+        if any(series_occurrences(series, day, day)):
+            raise SlotConflictError(
+                f"Slot {slot_date} {slot_time} is taken by booking series {series['id']}"
+            )
+
+
+def ensure_slot_open(conn: sqlite3.Connection, slot_date: str, slot_time: str):
+    """ensure_slot_free() plus a check against existing bookings rows."""
+    if conn.execute(
+        "SELECT 1 FROM bookings WHERE date = ? AND time = ?", (slot_date, slot_time)
+    ).fetchone():
+        raise SlotConflictError(f"Slot {slot_date} {slot_time} is already booked")
+    ensure_slot_free(conn, slot_date, slot_time)
@@ -1,4 +1,3 @@
-import redis
 from app.core.config import settings
 
 async def check_redis_connection() -> bool:
@@ -7,6 +6,8 @@ async def check_redis_connection() -> bool:
     Returns True if Redis is reachable, else False.
     """
     try:
+        import redis
+
         r = redis.Redis.from_url(
             settings.REDIS_URL,
             socket_connect_timeout=2
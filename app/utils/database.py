@@ -1,17 +1,55 @@
 import sqlite3
+from typing import Iterator, List, Optional, Sequence
+
+from app.utils.records import record_factory
 
 DB_NAME = "booking.db"
 
-def get_connection():
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
+# Stay below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds (999)
+SQLITE_MAX_VARIABLES = 900
+
+# Bump whenever create_tables() changes, so existing databases get the new DDL
+SCHEMA_VERSION = 3
+
+BOOKING_COLUMNS = (
+    "id", "customer_name", "customer_email", "customer_phone", "date", "time",
+    "description", "version", "created_at", "updated_at",
+)
+
+_COLUMN_LIST = ", ".join(BOOKING_COLUMNS)
+
+
+class SlotConflictError(sqlite3.IntegrityError):
+    """
+    A (date, time) slot is taken by something other than a bookings row
+    (e.g. a recurring series). Subclasses IntegrityError so callers that
+    already map UNIQUE(date, time) violations to 409 handle it the same way.
+    """
+
+
+def is_slot_conflict(error: sqlite3.IntegrityError) -> bool:
+    """True for a taken (date, time) slot, False for other constraint failures (e.g. email)."""
+    return isinstance(error, SlotConflictError) or "bookings.date, bookings.time" in str(error)
+
+
+def chunked(values: Sequence, size: int = SQLITE_MAX_VARIABLES) -> Iterator[List]:
+    for i in range(0, len(values), size):
+        yield list(values[i:i + size])
+
+
+def get_connection(db_name: Optional[str] = None):
+    conn = sqlite3.connect(db_name or DB_NAME)
+    conn.row_factory = record_factory
     return conn
 
 
-def create_tables():
-    conn = get_connection()
+def create_tables(db_name: Optional[str] = None):
+    conn = get_connection(db_name)
     cursor = conn.cursor()
 
+    # WAL lets readers run alongside the single writer connection
+    cursor.execute("PRAGMA journal_mode=WAL")
+
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS bookings (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -38,9 +76,169 @@ def create_tables():
     )
     """)
 
+    # Cold storage for past bookings (see app/services/archive_service.py).
+    # Ids are kept from the hot table, so no AUTOINCREMENT or UNIQUE slots here.
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS bookings_archive (
+        id INTEGER PRIMARY KEY,
+        customer_name TEXT NOT NULL,
+        customer_email TEXT NOT NULL,
+        customer_phone TEXT NOT NULL,
+        date TEXT NOT NULL,
+        time TEXT NOT NULL,
+        description TEXT,
+        version INTEGER DEFAULT 1,
+        created_at TIMESTAMP,
+        updated_at TIMESTAMP,
+        archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_bookings_archive_date ON bookings_archive (date)"
+    )
+
+    # Recurring bookings: stored once, occurrences expanded on read
+    # (see app/services/recurrence.py). end_date is the last occurrence.
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS booking_series (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        customer_name TEXT NOT NULL,
+        customer_email TEXT NOT NULL,
+        customer_phone TEXT NOT NULL,
+        description TEXT,
+        time TEXT NOT NULL,
+        start_date TEXT NOT NULL,
+        end_date TEXT NOT NULL,
+        freq TEXT NOT NULL CHECK (freq IN ('daily', 'weekly')),
+        interval INTEGER NOT NULL DEFAULT 1,
+        count INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_booking_series_time"
+        " ON booking_series (time, start_date, end_date)"
+    )
+
+    _create_occupancy_summaries(cursor)
+
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
     conn.close()
 
+
+def _create_occupancy_summaries(cursor):
+    """
+    Per-date and per-hour booking counts for calendar views.
+
+    Kept current by triggers on bookings and bookings_archive. Archival
+    inserts into the archive and deletes from the hot table, so it leaves
+    the counts unchanged. Rebuilt from scratch whenever the schema is
+    (re)created.
+    """
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS booking_daily_counts (
+        date TEXT PRIMARY KEY,
+        bookings INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS booking_hourly_counts (
+        date TEXT NOT NULL,
+        hour INTEGER NOT NULL,
+        bookings INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (date, hour)
+    ) WITHOUT ROWID
+    """)
+
+    increment = """
+        INSERT INTO booking_daily_counts (date, bookings) VALUES (NEW.date, 1)
+        ON CONFLICT(date) DO UPDATE SET bookings = bookings + 1;
+        INSERT INTO booking_hourly_counts (date, hour, bookings)
+        VALUES (NEW.date, CAST(substr(NEW.time, 1, 2) AS INTEGER), 1)
+        ON CONFLICT(date, hour) DO UPDATE SET bookings = bookings + 1;
+    """
+    decrement = """
+        UPDATE booking_daily_counts SET bookings = bookings - 1
+        WHERE date = OLD.date;
+        UPDATE booking_hourly_counts SET bookings = bookings - 1
+        WHERE date = OLD.date AND hour = CAST(substr(OLD.time, 1, 2) AS INTEGER);
+    """
+
+    for table in ("bookings", "bookings_archive"):
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_occupancy_ai AFTER INSERT ON {table}
+        BEGIN {increment} END
+        """)
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_occupancy_ad AFTER DELETE ON {table}
+        BEGIN {decrement} END
+        """)
+
+    cursor.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS bookings_occupancy_au AFTER UPDATE OF date, time ON bookings
+    WHEN OLD.date IS NOT NEW.date OR OLD.time IS NOT NEW.time
+    BEGIN {decrement} {increment} END
+    """)
+
+    # Backfill from existing rows
+    all_bookings = "SELECT date, time FROM bookings UNION ALL SELECT date, time FROM bookings_archive"
+    cursor.execute("DELETE FROM booking_daily_counts")
+    cursor.execute(f"""
+    INSERT INTO booking_daily_counts (date, bookings)
+    SELECT date, COUNT(*) FROM ({all_bookings}) GROUP BY date
+    """)
+    cursor.execute("DELETE FROM booking_hourly_counts")
+    cursor.execute(f"""
+    INSERT INTO booking_hourly_counts (date, hour, bookings)
+    SELECT date, CAST(substr(time, 1, 2) AS INTEGER) AS hour, COUNT(*)
+    FROM ({all_bookings}) GROUP BY date, hour
+    """)
+
+
+def ensure_schema() -> bool:
+    """
+    Run create_tables() only if the database is behind SCHEMA_VERSION.
+
+    Reading PRAGMA user_version is a header lookup, so an up-to-date
+    database starts without executing any DDL. Returns True if DDL ran.
+    """
+    conn = get_connection()
+    try:
+        current = conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+    if current >= SCHEMA_VERSION:
+        return False
+
+    create_tables()
+    return True
+
+
+def warm_up():
+    """Load the schema and the newest bookings pages before serving traffic."""
+    conn = get_connection()
+    try:
+        conn.execute("SELECT * FROM bookings ORDER BY id DESC LIMIT 100").fetchall()
+    finally:
+        conn.close()
+
+
+def booking_source(include_archived: bool = False) -> str:
+    """
+    FROM target for booking reads.
+
+    Only the hot table by default; with include_archived the archive is
+    appended with UNION ALL under the same column list.
+    """
+    if not include_archived:
+        return "bookings"
+    return (
+        f"(SELECT {_COLUMN_LIST} FROM bookings"
+        f" UNION ALL SELECT {_COLUMN_LIST} FROM bookings_archive)"
+    )
+
 async def check_db_connection() -> bool:
     try:
         conn = get_connection()
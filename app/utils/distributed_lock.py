@@ -3,8 +3,6 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from http.client import HTTPException
 
-import redis.asyncio as redis
-
 
 class DistributedLock:
     """
@@ -24,6 +22,9 @@ class DistributedLock:
     def __init__(self, lock_key: str, timeout_seconds: int = 5):
         self.lock_key = f"lock:{lock_key}"
         self.timeout = timeout_seconds
+
+        import redis.asyncio as redis
+
         self.redis_client = redis.Redis.from_url("redis://localhost:6379")
         self.lock_value = None
 
@@ -0,0 +1,89 @@
+import sqlite3
+from typing import Any, Dict, Iterator, Tuple
+
+# Column name -> position, shared by every row of the same column list
+Layout = Dict[str, int]
+
+_layouts: Dict[Tuple[str, ...], Layout] = {}
+_MAX_LAYOUTS = 256  # ?fields= projections make column lists client-controlled
+_last_layout: Tuple[Any, Layout] = (None, {})
+
+
+class Record:
+    """
+    Read-only result row: a shared column layout plus the raw values tuple.
+
+    Stands in for sqlite3.Row -> dict(row) copies. Supports row["name"],
+    row[0], row.get(), keys()/items() (so dict(row) and {**row} still
+    work) and iterates over values like a tuple. RecordJSONResponse
+    turns each one into a dict only while encoding it.
+    """
+
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, layout: Layout, values: Tuple[Any, ...]):
+        self._layout = layout
+        self._values = values
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._values[self._layout[key]]
+        return self._values[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._layout.get(key)
+        return default if index is None else self._values[index]
+
+    def __contains__(self, key) -> bool:
+        return key in self._layout
+
+    def keys(self):
+        return self._layout.keys()
+
+    def values(self) -> Tuple[Any, ...]:
+        return self._values
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return zip(self._layout, self._values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._layout, self._values))
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Record):
+            return self._values == other._values and self._layout.keys() == other._layout.keys()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Record({self.to_dict()!r})"
+
+
+def _layout_for(description) -> Layout:
+    global _last_layout
+    # The cursor keeps one description tuple per statement, so consecutive
+    # rows hit the identity check and skip building the name tuple
+    last_description, layout = _last_layout
+    if description is last_description:
+        return layout
+
+    names = tuple(column[0] for column in description)
+    layout = _layouts.get(names)
+    if layout is None:
+        if len(_layouts) >= _MAX_LAYOUTS:
+            _layouts.clear()
+        layout = _layouts.setdefault(names, {name: i for i, name in enumerate(names)})
+    _last_layout = (description, layout)
+    return layout
+
+
+def record_factory(cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> Record:
+    """sqlite3 row_factory producing Records."""
+    return Record(_layout_for(cursor.description), row)
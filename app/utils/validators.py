@@ -0,0 +1,29 @@
+from datetime import date, time
+
+BUSINESS_OPEN = time(8, 0)
+BUSINESS_CLOSE = time(20, 0)
+
+
+def validate_email_address(v: str) -> str:
+    # Imported on first use: email_validator pulls in dnspython at import time
+    from email_validator import validate_email, EmailNotValidError
+
+    try:
+        validate_email(v)
+    except EmailNotValidError:
+        raise ValueError("Invalid email format")
+    return v
+
+
+def validate_future_date(v: date) -> date:
+    if v < date.today():
+        raise ValueError("Date must be in the future")
+    return v
+
+
+def validate_business_hours(v: time) -> time:
+    if v.tzinfo is not None:
+        v = v.replace(tzinfo=None)
+    if v < BUSINESS_OPEN or v > BUSINESS_CLOSE:
+        raise ValueError("Time must be between 08:00 and 20:00")
+    return v
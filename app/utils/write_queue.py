@@ -0,0 +1,206 @@
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.utils.database import DB_NAME
+from app.utils.records import record_factory
+
+WriteOp = Callable[[sqlite3.Connection], Any]
+
+_STOP = object()
+
+
+class WriteTimeoutError(Exception):
+    """
+    execute() stopped waiting for a write.
+
+    `started` is False when the operation was still queued and has been
+    cancelled (nothing was written, safe to retry), True when the writer
+    had already started it and it may still commit.
+    """
+
+    def __init__(self, started: bool):
+        self.started = started
+        outcome = "may still be applied" if started else "was not applied"
+        super().__init__(f"Write timed out and {outcome}")
+
+
+class WriteQueue:
+    """
+    Single writer for all booking mutations.
+
+    Usage:
+        row = run_write(lambda conn: conn.execute(...).fetchone())
+
+    Implementation Notes:
+    - One background thread owns the only write connection
+    - Handlers submit operations (callables taking the connection) via a queue
+    - Pending operations are drained into one transaction (group commit),
+      so a burst of requests shares a single fsync
+    - Every operation runs inside its own SAVEPOINT; a failing operation
+      (e.g. IntegrityError) is rolled back alone and the rest still commit
+    - Each caller's future resolves only after the batch is committed
+    - If the batch itself fails (COMMIT error, or SQLite rolling back the
+      whole transaction mid-batch), every unresolved future in it gets the
+      error and the connection is rolled back or reopened; the writer
+      keeps running, and submit() restarts it if the thread died anyway
+    - execute() waits at most WRITE_TIMEOUT_SECONDS, then raises
+      WriteTimeoutError saying whether the operation can still commit
+    """
+
+    def __init__(
+        self,
+        db_name: str = DB_NAME,
+        max_batch_size: int = settings.WRITE_BATCH_SIZE,
+        max_batch_wait: float = settings.WRITE_BATCH_WAIT_MS / 1000,
+        timeout: float = settings.WRITE_TIMEOUT_SECONDS,
+    ):
+        self.db_name = db_name
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait = max_batch_wait
+        self.timeout = timeout
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="booking-writer", daemon=True
+            )
+            self._thread.start()
+            logger.info("Booking writer started")
+
+    def stop(self, timeout: float = 5.0):
+        with self._lock:
+            if not self._thread:
+                return
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+            logger.info("Booking writer stopped")
+
+    def submit(self, op: WriteOp) -> Future:
+        if not self._thread or not self._thread.is_alive():
+            self.start()
+        future: Future = Future()
+        self._queue.put((op, future))
+        return future
+
+    def execute(self, op: WriteOp) -> Any:
+        """Submit an operation and block until its batch is committed."""
+        future = self.submit(op)
+        try:
+            return future.result(self.timeout)
+        except FutureTimeoutError:
+            # cancel() only succeeds while the op is still queued; once the
+            # writer has started it, its outcome is unknown to the caller
+            raise WriteTimeoutError(started=not future.cancel()) from None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode: transactions and savepoints are managed explicitly
+        conn = sqlite3.connect(
+            self.db_name, isolation_level=None, check_same_thread=False
+        )
+        conn.row_factory = record_factory
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _next_batch(self, first):
+        batch = [first]
+        while len(batch) < self.max_batch_size:
+            try:
+                if self.max_batch_wait:
+                    item = self._queue.get(timeout=self.max_batch_wait)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        conn = self._connect()
+        try:
+            while True:
+                first = self._queue.get()
+                if first is _STOP:
+                    break
+                batch = self._next_batch(first)
+                try:
+                    self._commit_batch(conn, batch)
+                except BaseException as exc:
+                    logger.error(f"Write batch of {len(batch)} failed: {exc}")
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(exc)
+                    conn = self._recover(conn)
+        finally:
+            conn.close()
+
+    def _recover(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        """Roll back whatever is left of a failed batch, or reopen the connection."""
+        try:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            return conn
+        except sqlite3.Error as exc:
+            logger.error(f"Reopening writer connection after failed rollback: {exc}")
+            conn.close()
+            return self._connect()
+
+    def _commit_batch(self, conn: sqlite3.Connection, batch):
+        """
+        Run a batch in one transaction. Errors raised from here (BEGIN,
+        COMMIT, a lost transaction) mean none of the batch was committed;
+        _run() fails the futures not yet resolved.
+        """
+        results = []
+        conn.execute("BEGIN IMMEDIATE")
+
+        for op, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            conn.execute("SAVEPOINT booking_op")
+            try:
+                result = op(conn)
+            except BaseException as exc:
+                future.set_exception(exc)
+                if not conn.in_transaction:
+                    # SQLite rolled back the whole transaction (SQLITE_FULL,
+                    # IOERR, interrupt): earlier ops in the batch are lost too
+                    raise sqlite3.OperationalError(
+                        "Write batch rolled back by the database"
+                    ) from exc
+                conn.execute("ROLLBACK TO booking_op")
+                conn.execute("RELEASE booking_op")
+                continue
+            conn.execute("RELEASE booking_op")
+            results.append((future, result))
+
+        conn.execute("COMMIT")
+
+        for future, result in results:
+            future.set_result(result)
+
+
+_write_queue = WriteQueue()
+
+
+def get_write_queue() -> WriteQueue:
+    return _write_queue
+
+
+def run_write(op: WriteOp) -> Any:
+    return _write_queue.execute(op)
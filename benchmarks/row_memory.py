@@ -0,0 +1,96 @@
+"""
+Memory used to fetch and serialize booking rows.
+
+    python -m benchmarks.row_memory --rows 100000
+
+Compares the previous path (sqlite3.Row -> dict(row) -> jsonable_encoder
+-> json.dumps) with Records rendered by RecordJSONResponse, measuring with
+tracemalloc the bytes held by the fetched rows and the peak while the
+response body is built.
+"""
+import argparse
+import json
+import sqlite3
+import time
+import tracemalloc
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.response import RecordJSONResponse, success_response
+from app.utils.records import record_factory
+from tests.fixtures.test_data import generate_bookings
+
+
+def _database(rows: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""
+    CREATE TABLE bookings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        customer_name TEXT NOT NULL,
+        customer_email TEXT UNIQUE NOT NULL,
+        customer_phone TEXT NOT NULL,
+        date TEXT NOT NULL,
+        time TEXT NOT NULL,
+        description TEXT,
+        version INTEGER DEFAULT 1,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+    for batch in generate_bookings(rows):
+        conn.executemany("""
+            INSERT INTO bookings
+            (customer_name, customer_email, customer_phone, date, time, description)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, batch)
+    return conn
+
+
+def _previous(conn: sqlite3.Connection):
+    conn.row_factory = sqlite3.Row
+    rows = [dict(row) for row in conn.execute("SELECT * FROM bookings")]
+    fetched = tracemalloc.get_traced_memory()[0]
+    body = json.dumps(
+        jsonable_encoder(success_response(data={"bookings": rows})),
+        ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+    ).encode("utf-8")
+    return fetched, len(body)
+
+
+def _records(conn: sqlite3.Connection):
+    conn.row_factory = record_factory
+    rows = conn.execute("SELECT * FROM bookings").fetchall()
+    fetched = tracemalloc.get_traced_memory()[0]
+    body = RecordJSONResponse(success_response(data={"bookings": rows})).body
+    return fetched, len(body)
+
+
+def measure(name: str, fn, conn: sqlite3.Connection, rows: int):
+    tracemalloc.start()
+    started = time.perf_counter()
+    fetched, body_size = fn(conn)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(
+        f"{name:<10} rows held: {fetched / rows:7.1f} B/row   "
+        f"peak: {peak / 2**20:8.1f} MiB   body: {body_size / 2**20:6.1f} MiB   "
+        f"time: {elapsed:6.2f}s"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare row representations.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    conn = _database(args.rows)
+    try:
+        measure("previous", _previous, conn, args.rows)
+        measure("records", _records, conn, args.rows)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
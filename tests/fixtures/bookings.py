@@ -0,0 +1,25 @@
+"""Request bodies and helpers shared by the API tests."""
+from datetime import date, timedelta
+
+HEADERS = {"X-Idempotency-Key": "test-key"}
+BOOKING_DATE = str(date.today() + timedelta(days=7))
+
+
+def booking_body(n: int = 0, **overrides) -> dict:
+    """A valid POST /api/v1/bookings body; n varies the email and hour."""
+    body = {
+        "customer_name": "Alice Smith",
+        "customer_email": f"alice{n}@gmail.com",
+        "customer_phone": "9876543210",
+        "date": BOOKING_DATE,
+        "time": f"{10 + n:02d}:00",
+        "description": "Consultation",
+    }
+    body.update(overrides)
+    return body
+
+
+def create_booking(client, n: int = 0, **overrides) -> dict:
+    response = client.post("/api/v1/bookings/", json=booking_body(n, **overrides), headers=HEADERS)
+    assert response.status_code == 201, response.text
+    return response.json()["data"]
@@ -0,0 +1,248 @@
+"""
+Synthetic booking data for tests and benchmarks.
+
+    python -m tests.fixtures.test_data --rows 5000000 --db bench.db
+
+Row i is a pure function of (i, seed, start_date): small lookup tables
+(weighted names, domains, descriptions, days, slot times) are indexed by
+a multiplicative hash of i. generate_bookings() evaluates that in Python;
+bulk_load() evaluates the same expressions inside SQLite, so a multi-
+million-row database is built by a single INSERT ... SELECT.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import time as clock
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.utils.database import create_tables
+
+BookingRow = Tuple[str, str, str, str, str, Optional[str]]
+
+# Ranked by frequency; weights fall off as 1/rank (roughly Zipf)
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Priya", "Rahul", "Ananya", "Arjun",
+    "Wei", "Mei", "Hiroshi", "Yuki", "Omar", "Fatima", "Carlos", "Sofia",
+    "Luca", "Giulia", "Lukas", "Emma", "Noah", "Olivia", "Mateo", "Amara",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Sharma", "Patel", "Singh",
+    "Kumar", "Wang", "Li", "Zhang", "Tanaka", "Suzuki", "Khan", "Ali",
+    "Rossi", "Bianchi", "Muller", "Schmidt", "Dubois", "Silva", "Okafor", "Nguyen",
+]
+EMAIL_DOMAINS = ["gmail.com", "outlook.com", "yahoo.com", "icloud.com", "proton.me"]
+# None repeated so most bookings have no description
+DESCRIPTIONS = [
+    None, None, None, None, "Consultation", "Follow-up visit", "Initial assessment",
+    "Annual review", "Team meeting", "Product demo", "Support call",
+]
+
+# Business hours are 08:00-20:00 inclusive; one slot per minute
+SLOT_TIMES = [
+    f"{minutes // 60:02d}:{minutes % 60:02d}:00"
+    for minutes in range(8 * 60, 20 * 60 + 1)
+]
+SLOTS_PER_DAY = len(SLOT_TIMES)
+
+# Weighted sample of (full name, email local part) that rows index into
+PEOPLE_TABLE_SIZE = 4096
+
+# Knuth multiplicative hash; i * factor stays well inside SQLite's int64
+_HASH_FACTOR = 2654435761
+_HASH_MODULUS = 2 ** 32
+
+
+def _people(seed: int) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    combos = [(first, last) for first in FIRST_NAMES for last in LAST_NAMES]
+    weights = list(accumulate(
+        1 / (f * l)
+        for f in range(1, len(FIRST_NAMES) + 1)
+        for l in range(1, len(LAST_NAMES) + 1)
+    ))
+    return [
+        (f"{first} {last}", f"{first}.{last}".lower())
+        for first, last in rng.choices(combos, cum_weights=weights, k=PEOPLE_TABLE_SIZE)
+    ]
+
+
+def _days(count: int, start_date: Optional[date]) -> List[str]:
+    # Starts tomorrow by default so every row passes the future-date check
+    start_date = start_date or date.today() + timedelta(days=1)
+    return [str(start_date + timedelta(days=d)) for d in range(count // SLOTS_PER_DAY + 1)]
+
+
+def generate_bookings(
+    count: int,
+    start_date: Optional[date] = None,
+    batch_size: int = 100_000,
+    seed: int = 0,
+) -> Iterator[List[BookingRow]]:
+    """
+    Yield valid bookings in batches of (name, email, phone, date, time, description).
+
+    - Emails are unique: the row index is part of the local part
+    - Slots are unique: row i takes minute i % SLOTS_PER_DAY of day
+      i // SLOTS_PER_DAY
+    - Phones are 10 digits without a leading zero (PHONE_PATTERN)
+    """
+    people = _people(seed)
+    days = _days(count, start_date)
+
+    for offset in range(0, count, batch_size):
+        batch = []
+        for i in range(offset, min(offset + batch_size, count)):
+            h = (i * _HASH_FACTOR + seed) % _HASH_MODULUS
+            name, local = people[(h >> 20) % PEOPLE_TABLE_SIZE]
+            batch.append((
+                name,
+                f"{local}.{i}@{EMAIL_DOMAINS[(h >> 12) % len(EMAIL_DOMAINS)]}",
+                str(6_000_000_000 + (i * 7_919) % 3_999_999_999),
+                days[i // SLOTS_PER_DAY],
+                SLOT_TIMES[i % SLOTS_PER_DAY],
+                DESCRIPTIONS[h % len(DESCRIPTIONS)],
+            ))
+        yield batch
+
+
+def booking_payload(index: int, start_date: Optional[date] = None, seed: int = 0) -> dict:
+    """Row `index` as a POST /api/v1/bookings body."""
+    rows = next(generate_bookings(index + 1, start_date, batch_size=index + 1, seed=seed))
+    name, email, phone, day, slot_time, description = rows[index]
+    return {
+        "customer_name": name,
+        "customer_email": email,
+        "customer_phone": phone,
+        "date": day,
+        "time": slot_time[:5],
+        "description": description,
+    }
+
+
+def _create_lookup_tables(conn: sqlite3.Connection, rows: int, start_date: Optional[date], seed: int):
+    tables: Dict[str, List[tuple]] = {
+        "fixture_people (k INTEGER PRIMARY KEY, name TEXT, local TEXT)":
+            [(k, name, local) for k, (name, local) in enumerate(_people(seed))],
+        "fixture_domains (k INTEGER PRIMARY KEY, domain TEXT)":
+            list(enumerate(EMAIL_DOMAINS)),
+        "fixture_descriptions (k INTEGER PRIMARY KEY, description TEXT)":
+            list(enumerate(DESCRIPTIONS)),
+        "fixture_days (k INTEGER PRIMARY KEY, date TEXT)":
+            list(enumerate(_days(rows, start_date))),
+        "fixture_slots (k INTEGER PRIMARY KEY, time TEXT)":
+            list(enumerate(SLOT_TIMES)),
+    }
+    for definition, values in tables.items():
+        table = definition.split(" ", 1)[0]
+        conn.execute(f"CREATE TEMP TABLE {definition}")
+        placeholders = ", ".join("?" * len(values[0]))
+        conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", values)
+
+
+def bulk_load(
+    db_path: str,
+    rows: int,
+    seed: int = 0,
+    start_date: Optional[date] = None,
+) -> float:
+    """
+    Build a fresh database at db_path with `rows` generated bookings.
+
+    Implementation Notes:
+    - Rows come from one INSERT ... SELECT over a recursive counter
+      joined to the lookup tables by primary key, so no row is built or
+      bound in Python; it produces the same rows as generate_bookings()
+    - The bookings table is created without its UNIQUE constraints and
+      the two unique indexes are built after the load, which sorts once
+      instead of maintaining B-trees on every insert
+    - Rollback journal off, synchronous off and an exclusive lock for the
+      load; create_tables() switches the file back to WAL, adds the other
+      tables, triggers and occupancy summaries, and stamps the schema version
+
+    Returns the elapsed seconds.
+    """
+    started = clock.perf_counter()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-262144")  # 256 MiB
+
+        # Same columns as create_tables(); uniqueness is added after the load
+        conn.execute("""
+        CREATE TABLE bookings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            customer_name TEXT NOT NULL,
+            customer_email TEXT NOT NULL,
+            customer_phone TEXT NOT NULL,
+            date TEXT NOT NULL,
+            time TEXT NOT NULL,
+            description TEXT,
+            version INTEGER DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+        _create_lookup_tables(conn, rows, start_date, seed)
+
+        if rows > 0:
+            conn.execute(f"""
+            WITH RECURSIVE counter(i, h) AS (
+                SELECT 0, :seed % {_HASH_MODULUS}
+                UNION ALL
+                SELECT i + 1, ((i + 1) * {_HASH_FACTOR} + :seed) % {_HASH_MODULUS}
+                FROM counter WHERE i < :last
+            )
+            INSERT INTO bookings
+            (customer_name, customer_email, customer_phone, date, time, description)
+            SELECT
+                p.name,
+                p.local || '.' || c.i || '@' || m.domain,
+                CAST(6000000000 + (c.i * 7919) % 3999999999 AS TEXT),
+                d.date,
+                s.time,
+                x.description
+            FROM counter c
+            JOIN fixture_people p ON p.k = (c.h >> 20) % {PEOPLE_TABLE_SIZE}
+            JOIN fixture_domains m ON m.k = (c.h >> 12) % {len(EMAIL_DOMAINS)}
+            JOIN fixture_descriptions x ON x.k = c.h % {len(DESCRIPTIONS)}
+            JOIN fixture_days d ON d.k = c.i / {SLOTS_PER_DAY}
+            JOIN fixture_slots s ON s.k = c.i % {SLOTS_PER_DAY}
+            """, {"seed": seed, "last": rows - 1})
+
+        conn.execute("CREATE UNIQUE INDEX bookings_customer_email ON bookings (customer_email)")
+        conn.execute("CREATE UNIQUE INDEX bookings_slot ON bookings (date, time)")
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    create_tables(db_path)
+    return clock.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a synthetic booking database.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--db", default="bench.db")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    elapsed = bulk_load(args.db, args.rows, args.seed)
+    print(f"Loaded {args.rows} bookings into {args.db} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
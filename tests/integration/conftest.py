@@ -0,0 +1,17 @@
+import email_validator
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import slot_holds
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # Fresh database (DB_NAME is relative to the working directory) and
+    # hold registry per test; no DNS lookups for email deliverability
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(email_validator, "CHECK_DELIVERABILITY", False)
+    monkeypatch.setattr(slot_holds, "_slot_holds", slot_holds.SlotHoldManager(use_redis=False))
+    with TestClient(app) as test_client:
+        yield test_client
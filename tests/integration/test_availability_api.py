@@ -0,0 +1,43 @@
+from datetime import date, datetime, time
+
+from app.api.v1 import booking as booking_api
+from tests.fixtures.bookings import BOOKING_DATE, HEADERS, booking_body, create_booking
+
+
+def test_next_available_accepts_timezone_aware_after(client):
+    create_booking(client, time="10:00")
+
+    response = client.get(
+        "/api/v1/bookings/next-available",
+        params={"after": f"{BOOKING_DATE}T09:59:30", "limit": 2},
+    )
+
+    assert response.status_code == 200
+    assert [slot["time"] for slot in response.json()["data"]["slots"]] == ["10:30:00", "11:00:00"]
+    aware = client.get(
+        "/api/v1/bookings/next-available", params={"after": f"{BOOKING_DATE}T09:59:00Z"}
+    )
+    assert aware.status_code == 200
+
+
+def test_conflict_alternatives_are_never_in_the_past(client, monkeypatch):
+    today = date.today()
+    noon = datetime.combine(today, time(12, 10))
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return noon
+
+    create_booking(client, 0, date=str(today), time="08:00")
+    monkeypatch.setattr(booking_api, "datetime", FrozenDatetime)
+
+    response = client.post(
+        "/api/v1/bookings/", json=booking_body(1, date=str(today), time="08:00"), headers=HEADERS
+    )
+
+    assert response.status_code == 409
+    alternatives = response.json()["detail"]["error"]["details"]["alternatives"]
+    assert [(slot["date"], slot["time"]) for slot in alternatives] == [
+        (str(today), "12:30:00"), (str(today), "13:00:00"), (str(today), "13:30:00"),
+    ]
@@ -0,0 +1,35 @@
+from app.core.config import settings
+from tests.fixtures.bookings import create_booking
+
+
+def test_batch_keeps_request_order_duplicates_and_not_found_markers(client):
+    first = create_booking(client, 0)
+    second = create_booking(client, 1)
+    ids = [second["id"], 999, first["id"], second["id"]]
+
+    by_get = client.get("/api/v1/bookings/batch", params={"ids": ",".join(map(str, ids))})
+    by_post = client.post("/api/v1/bookings/batch", json={"ids": ids})
+
+    for response in (by_get, by_post):
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [r["id"] for r in data["results"]] == ids
+        assert [r["found"] for r in data["results"]] == [True, False, True, True]
+        assert data["results"][1]["booking"] is None
+        assert data["results"][0]["booking"]["customer_email"] == second["customer_email"]
+        assert (data["requested"], data["found"]) == (4, 3)
+
+
+def test_batch_get_is_capped_but_post_accepts_more(client):
+    ids = list(range(1, settings.BATCH_GET_MAX_IDS + 2))
+
+    too_many = client.get("/api/v1/bookings/batch", params={"ids": ",".join(map(str, ids))})
+    posted = client.post("/api/v1/bookings/batch", json={"ids": ids})
+
+    assert too_many.status_code == 400
+    assert posted.status_code == 200
+    assert posted.json()["data"]["found"] == 0
+
+
+def test_batch_rejects_non_integer_ids(client):
+    assert client.get("/api/v1/bookings/batch", params={"ids": "1,x"}).status_code == 400
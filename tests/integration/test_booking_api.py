@@ -0,0 +1,212 @@
+import sqlite3
+import threading
+
+from app.utils.database import DB_NAME
+from app.utils.write_queue import get_write_queue
+from tests.fixtures.bookings import BOOKING_DATE, HEADERS, booking_body, create_booking
+
+
+def history_rows(booking_id):
+    conn = sqlite3.connect(DB_NAME)
+    try:
+        return conn.execute(
+            "SELECT COUNT(*) FROM booking_history WHERE booking_id = ?", (booking_id,)
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+# ---------------- Write queue ----------------
+
+def test_write_timeout_is_503_with_retry_after(client, monkeypatch):
+    running, gate = threading.Event(), threading.Event()
+    write_queue = get_write_queue()
+    write_queue.submit(lambda conn: (running.set(), gate.wait(5)))
+    running.wait(5)
+    monkeypatch.setattr(write_queue, "timeout", 0.05)
+
+    try:
+        response = client.post("/api/v1/bookings/", json=booking_body(), headers=HEADERS)
+    finally:
+        gate.set()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["error"]["code"] == "WRITE_NOT_APPLIED"
+
+
+# ---------------- If-Match ----------------
+
+def test_put_with_current_etag_updates_and_bumps_version(client):
+    created = create_booking(client)
+
+    response = client.put(
+        f"/api/v1/bookings/{created['id']}",
+        json=booking_body(description="Follow-up visit"),
+        headers={**HEADERS, "If-Match": '"1"'},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"2"'
+    assert response.json()["data"]["updated_fields"] == ["description"]
+
+
+def test_stale_if_match_is_412(client):
+    created = create_booking(client)
+    client.patch(f"/api/v1/bookings/{created['id']}", json={"description": "v2"}, headers=HEADERS)
+
+    response = client.patch(
+        f"/api/v1/bookings/{created['id']}",
+        json={"description": "v3"},
+        headers={**HEADERS, "If-Match": '"1"'},
+    )
+
+    assert response.status_code == 412
+    details = response.json()["detail"]["error"]["details"]
+    assert details == {"expected_version": 1, "current_version": 2}
+
+
+def test_if_match_on_missing_booking_is_404(client):
+    response = client.patch(
+        "/api/v1/bookings/999", json={"description": "x"}, headers={**HEADERS, "If-Match": '"1"'}
+    )
+
+    assert response.status_code == 404
+
+
+def test_malformed_if_match_is_412(client):
+    created = create_booking(client)
+
+    response = client.patch(
+        f"/api/v1/bookings/{created['id']}",
+        json={"description": "x"},
+        headers={**HEADERS, "If-Match": "not-an-etag"},
+    )
+
+    assert response.status_code == 412
+
+
+def test_if_none_match_with_current_etag_is_304(client):
+    created = create_booking(client)
+    first = client.get(f"/api/v1/bookings/search/{created['id']}")
+
+    again = client.get(
+        f"/api/v1/bookings/search/{created['id']}", headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    assert first.headers["ETag"] == '"1"'
+    assert again.status_code == 304
+
+
+# ---------------- Field projection ----------------
+
+def test_projected_etag_does_not_revalidate_the_full_booking(client):
+    created = create_booking(client)
+    url = f"/api/v1/bookings/search/{created['id']}"
+    projected = client.get(url, params={"fields": "id"})
+
+    full = client.get(url, headers={"If-None-Match": projected.headers["ETag"]})
+    projected_again = client.get(
+        url, params={"fields": "id"}, headers={"If-None-Match": projected.headers["ETag"]}
+    )
+
+    assert projected.json()["data"]["result"] == {"id": created["id"]}
+    assert projected.headers["ETag"] != '"1"'
+    assert full.status_code == 200
+    assert full.json()["data"]["result"]["customer_name"] == created["customer_name"]
+    assert projected_again.status_code == 304
+
+
+def test_projected_etag_still_works_for_if_match(client):
+    created = create_booking(client)
+    projected = client.get(f"/api/v1/bookings/search/{created['id']}", params={"fields": "id"})
+
+    response = client.patch(
+        f"/api/v1/bookings/{created['id']}",
+        json={"description": "v2"},
+        headers={**HEADERS, "If-Match": projected.headers["ETag"]},
+    )
+
+    assert response.status_code == 200
+
+
+def test_list_projection_and_compact_mode(client):
+    create_booking(client, 0)
+    create_booking(client, 1)
+    params = {"fields": "id,time", "date_filter": BOOKING_DATE}
+
+    objects = client.get("/api/v1/bookings/", params=params).json()["data"]["bookings"]
+    compact = client.get("/api/v1/bookings/", params={**params, "compact": True}).json()["data"]["bookings"]
+
+    assert [set(row) for row in objects] == [{"id", "time"}] * 2
+    assert compact["columns"] == ["id", "time"]
+    assert sorted(row[1] for row in compact["rows"]) == ["10:00:00", "11:00:00"]
+
+
+def test_unknown_field_is_400(client):
+    response = client.get("/api/v1/bookings/", params={"fields": "id,password"})
+
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+
+# ---------------- PATCH ----------------
+
+def test_patch_without_changes_writes_nothing(client):
+    created = create_booking(client)
+
+    response = client.patch(
+        f"/api/v1/bookings/{created['id']}",
+        json={"customer_name": created["customer_name"]},
+        headers=HEADERS,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["updated_fields"] == []
+    assert response.headers["ETag"] == '"1"'
+    assert history_rows(created["id"]) == 0
+
+
+def test_patch_records_one_history_row(client):
+    created = create_booking(client)
+
+    response = client.patch(
+        f"/api/v1/bookings/{created['id']}",
+        json={"customer_name": "Alice Jones", "description": created["description"]},
+        headers=HEADERS,
+    )
+
+    assert response.json()["data"]["updated_fields"] == ["customer_name"]
+    assert response.headers["ETag"] == '"2"'
+    assert history_rows(created["id"]) == 1
+
+
+def test_patch_validates_only_the_fields_sent(client):
+    created = create_booking(client)
+
+    bad = client.patch(f"/api/v1/bookings/{created['id']}", json={"time": "21:00"}, headers=HEADERS)
+    null = client.patch(f"/api/v1/bookings/{created['id']}", json={"customer_name": None}, headers=HEADERS)
+
+    assert bad.status_code == 422
+    assert null.status_code == 422
+
+
+# ---------------- Calendar ----------------
+
+def test_calendar_reports_daily_and_hourly_counts(client):
+    create_booking(client, 0)
+    create_booking(client, 1, time="10:30")
+    create_booking(client, 2, date="2099-01-01")
+    month = BOOKING_DATE[:7]
+
+    response = client.get("/api/v1/bookings/calendar", params={"month": month})
+
+    data = response.json()["data"]
+    days = {day["date"]: day for day in data["days"]}
+    assert data["total_bookings"] == 2
+    assert days[BOOKING_DATE]["bookings"] == 2
+    assert days[BOOKING_DATE]["hours"] == {"10": 2}
+
+
+def test_calendar_rejects_bad_month(client):
+    assert client.get("/api/v1/bookings/calendar", params={"month": "2099-13"}).status_code == 400
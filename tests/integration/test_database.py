@@ -0,0 +1,101 @@
+import sqlite3
+
+from app.services.archive_service import archive_past_bookings
+from app.utils.database import DB_NAME
+from tests.fixtures.bookings import BOOKING_DATE, HEADERS, create_booking
+
+
+def count(table):
+    conn = sqlite3.connect(DB_NAME)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+# ---------------- Archival ----------------
+
+def test_archival_moves_rows_before_the_cutoff(client):
+    create_booking(client, 0)
+    create_booking(client, 1, date="2099-01-01")
+    create_booking(client, 2)
+
+    moved = archive_past_bookings(cutoff="2099-01-01", batch_size=1)
+
+    assert moved == 2
+    assert count("bookings") == 1
+    assert count("bookings_archive") == 2
+
+
+def test_archived_rows_are_listed_only_with_include_archived(client):
+    archived = create_booking(client, 0)
+    create_booking(client, 1, date="2099-01-01")
+    archive_past_bookings(cutoff="2099-01-01")
+
+    hot = client.get("/api/v1/bookings/", params={"date_filter": BOOKING_DATE})
+    everything = client.get(
+        "/api/v1/bookings/", params={"date_filter": BOOKING_DATE, "include_archived": True}
+    )
+
+    assert hot.json()["data"]["total_records"] == 0
+    assert [b["id"] for b in everything.json()["data"]["bookings"]] == [archived["id"]]
+    assert client.get(f"/api/v1/bookings/search/{archived['id']}").status_code == 404
+    found = client.get(f"/api/v1/bookings/search/{archived['id']}", params={"include_archived": True})
+    assert found.json()["data"]["result"]["customer_email"] == archived["customer_email"]
+
+
+def test_archived_slot_can_be_booked_again(client):
+    create_booking(client, 0)
+    archive_past_bookings(cutoff="2099-01-01")
+
+    create_booking(client, 5, time="10:00")
+
+
+# ---------------- Occupancy summaries ----------------
+
+def daily_counts():
+    conn = sqlite3.connect(DB_NAME)
+    try:
+        return dict(conn.execute("SELECT date, bookings FROM booking_daily_counts WHERE bookings > 0"))
+    finally:
+        conn.close()
+
+
+def hourly_counts():
+    conn = sqlite3.connect(DB_NAME)
+    try:
+        return {
+            (day, hour): n for day, hour, n in conn.execute(
+                "SELECT date, hour, bookings FROM booking_hourly_counts WHERE bookings > 0"
+            )
+        }
+    finally:
+        conn.close()
+
+
+def test_counts_follow_insert_move_and_delete(client):
+    first = create_booking(client, 0)
+    second = create_booking(client, 1)
+    assert daily_counts() == {BOOKING_DATE: 2}
+    assert hourly_counts() == {(BOOKING_DATE, 10): 1, (BOOKING_DATE, 11): 1}
+
+    client.patch(
+        f"/api/v1/bookings/{first['id']}",
+        json={"date": "2099-01-01", "time": "15:30"},
+        headers=HEADERS,
+    )
+    assert daily_counts() == {BOOKING_DATE: 1, "2099-01-01": 1}
+    assert hourly_counts() == {(BOOKING_DATE, 11): 1, ("2099-01-01", 15): 1}
+
+    client.delete(f"/api/v1/bookings/{second['id']}", headers=HEADERS)
+    assert daily_counts() == {"2099-01-01": 1}
+
+
+def test_archival_leaves_counts_unchanged(client):
+    create_booking(client, 0)
+    create_booking(client, 1)
+
+    archive_past_bookings(cutoff="2099-01-01")
+
+    assert count("bookings") == 0
+    assert daily_counts() == {BOOKING_DATE: 2}
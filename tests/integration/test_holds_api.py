@@ -0,0 +1,48 @@
+from tests.fixtures.bookings import BOOKING_DATE, HEADERS, booking_body, create_booking
+
+
+def hold(client, slot_time="10:00"):
+    response = client.post(
+        "/api/v1/bookings/holds/",
+        json={"date": BOOKING_DATE, "time": slot_time},
+        headers=HEADERS,
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["data"]["hold_id"]
+
+
+def test_held_slot_blocks_bookings_and_second_holds(client):
+    hold(client)
+
+    booked = client.post("/api/v1/bookings/", json=booking_body(), headers=HEADERS)
+    held_again = client.post(
+        "/api/v1/bookings/holds/", json={"date": BOOKING_DATE, "time": "10:00"}, headers=HEADERS
+    )
+
+    assert booked.status_code == 409
+    assert held_again.status_code == 409
+
+
+def test_confirm_turns_hold_into_booking(client):
+    hold_id = hold(client)
+
+    mismatch = client.post(
+        f"/api/v1/bookings/holds/{hold_id}/confirm", json=booking_body(1), headers=HEADERS
+    )
+    confirmed = client.post(
+        f"/api/v1/bookings/holds/{hold_id}/confirm", json=booking_body(), headers=HEADERS
+    )
+
+    assert mismatch.status_code == 409
+    assert mismatch.json()["detail"]["error"]["code"] == "HOLD_SLOT_MISMATCH"
+    assert confirmed.status_code == 201
+    assert confirmed.json()["data"]["time"] == "10:00:00"
+    # The hold is gone once the booking exists
+    assert client.delete(f"/api/v1/bookings/holds/{hold_id}", headers=HEADERS).status_code == 404
+
+
+def test_released_hold_frees_slot(client):
+    hold_id = hold(client)
+
+    assert client.delete(f"/api/v1/bookings/holds/{hold_id}", headers=HEADERS).status_code == 200
+    create_booking(client)
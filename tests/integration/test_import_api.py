@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.config import settings
+from app.services import import_service
+from tests.fixtures.bookings import BOOKING_DATE, HEADERS
+
+HEADER_ROW = "customer_name,customer_email,customer_phone,date,time,description"
+
+
+@pytest.fixture
+def import_pool(monkeypatch):
+    # Threads instead of spawned processes, so the test's email_validator
+    # settings (no DNS lookups) apply to validation too
+    pool = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(import_service, "get_import_pool", lambda: pool)
+    monkeypatch.setattr(settings, "IMPORT_CHUNK_SIZE", 2)
+    yield pool
+    pool.shutdown()
+
+
+def upload(client, *lines):
+    body = "\n".join((HEADER_ROW, *lines)) + "\n"
+    return client.post(
+        "/api/v1/bookings/import/",
+        files={"file": ("bookings.csv", body.encode(), "text/csv")},
+        headers=HEADERS,
+    )
+
+
+def test_import_reports_conflicts_and_invalid_rows_by_line(client, import_pool):
+    response = upload(
+        client,
+        f"Alice Smith,alice0@gmail.com,9876543210,{BOOKING_DATE},10:00,First",
+        f"Bob Smith,bob@gmail.com,9876543211,{BOOKING_DATE},10:00,",
+        f"Alice Again,alice0@gmail.com,9876543212,{BOOKING_DATE},11:00,",
+        f"Carol Smith,carol@gmail.com,12345,{BOOKING_DATE},12:00,",
+        f"Dave Smith,dave@gmail.com,9876543213,{BOOKING_DATE},13:00,",
+    )
+
+    assert response.status_code == 200
+    report = response.json()["data"]
+    assert (report["total_rows"], report["imported"], report["rejected"]) == (5, 2, 3)
+    assert report["completed"] is True
+    errors = {error["line"]: error["error"] for error in report["errors"]}
+    assert errors[3] == "Selected time slot already booked"
+    assert errors[4] == "This email ID is already reserved"
+    assert "customer_phone" in errors[5]
+
+    listed = client.get("/api/v1/bookings/", params={"date_filter": BOOKING_DATE, "limit": 10})
+    assert sorted(b["time"] for b in listed.json()["data"]["bookings"]) == ["10:00:00", "13:00:00"]
+
+
+def test_import_without_required_columns_is_400(client, import_pool):
+    response = client.post(
+        "/api/v1/bookings/import/",
+        files={"file": ("bookings.csv", b"customer_name,date\nAlice,2099-01-01\n", "text/csv")},
+        headers=HEADERS,
+    )
+
+    assert response.status_code == 400
+    assert "customer_email" in response.json()["detail"]
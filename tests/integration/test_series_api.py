@@ -0,0 +1,99 @@
+from datetime import date, timedelta
+
+from tests.fixtures.bookings import HEADERS, create_booking
+
+START = date.today() + timedelta(days=7)
+
+
+def series_body(**overrides) -> dict:
+    body = {
+        "customer_name": "Bob Jones",
+        "customer_email": "bob@gmail.com",
+        "customer_phone": "9876543210",
+        "start_date": str(START),
+        "time": "09:00",
+        "freq": "weekly",
+        "count": 4,
+    }
+    body.update(overrides)
+    return body
+
+
+def create_series(client, **overrides):
+    return client.post("/api/v1/bookings/series/", json=series_body(**overrides), headers=HEADERS)
+
+
+def test_series_conflicting_with_a_booking_lists_the_dates(client):
+    create_booking(client, date=str(START + timedelta(weeks=2)), time="09:00")
+
+    response = create_series(client)
+
+    assert response.status_code == 409
+    details = response.json()["detail"]["error"]["details"]
+    assert details["conflicting_dates"] == [str(START + timedelta(weeks=2))]
+
+
+def test_series_conflicting_with_another_series_is_rejected(client):
+    assert create_series(client).status_code == 201
+
+    daily = create_series(client, freq="daily", count=10, start_date=str(START + timedelta(days=1)))
+
+    assert daily.status_code == 409
+    assert daily.json()["detail"]["error"]["details"]["conflicting_dates"] == [
+        str(START + timedelta(weeks=1))
+    ]
+    assert create_series(client, time="09:30").status_code == 201
+
+
+def test_booking_on_a_series_occurrence_is_409(client):
+    create_series(client)
+
+    response = client.post(
+        "/api/v1/bookings/",
+        json={
+            "customer_name": "Alice Smith",
+            "customer_email": "alice@gmail.com",
+            "customer_phone": "9876543210",
+            "date": str(START + timedelta(weeks=1)),
+            "time": "09:00",
+        },
+        headers=HEADERS,
+    )
+
+    assert response.status_code == 409
+
+
+def test_occurrences_are_expanded_only_inside_the_window(client):
+    series_id = create_series(client).json()["data"]["id"]
+
+    window = client.get(
+        "/api/v1/bookings/series/occurrences",
+        params={"start": str(START + timedelta(days=1)), "end": str(START + timedelta(weeks=2))},
+    )
+
+    assert window.json()["data"]["occurrences"] == [
+        {"series_id": series_id, "date": str(START + timedelta(weeks=w)), "time": "09:00:00"}
+        for w in (1, 2)
+    ]
+
+
+def test_date_filtered_list_includes_series_occurrences(client):
+    create_series(client)
+    create_booking(client, date=str(START))
+    day = {"date_filter": str(START)}
+
+    listed = client.get("/api/v1/bookings/", params=day).json()["data"]
+    by_customer = client.get("/api/v1/bookings/", params={**day, "customer": "bob"}).json()["data"]
+    calendar = client.get("/api/v1/bookings/calendar", params={"month": str(START)[:7]}).json()["data"]
+
+    assert listed["total_records"] == 1
+    assert [(o["customer_name"], o["time"]) for o in listed["occurrences"]] == [("Bob Jones", "09:00:00")]
+    assert by_customer["bookings"] == [] and len(by_customer["occurrences"]) == 1
+    calendar_day = next(d for d in calendar["days"] if d["date"] == str(START))
+    assert calendar_day["bookings"] == len(listed["bookings"]) + len(listed["occurrences"])
+
+
+def test_list_without_date_filter_has_no_occurrences(client):
+    create_series(client)
+
+    assert client.get("/api/v1/bookings/").json()["data"]["occurrences"] == []
@@ -0,0 +1,49 @@
+import pytest
+from fastapi import HTTPException
+
+from app.models.booking import BookingUpdate
+from app.services.booking_service import BookingService
+from app.utils.database import create_tables
+from app.utils.write_queue import get_write_queue
+from tests.fixtures.bookings import booking_body
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # DB_NAME is relative
+    create_tables()
+    write_queue = get_write_queue()
+    write_queue.start()
+    yield BookingService()
+    write_queue.stop()
+
+
+def create(service, n=0):
+    return service.repository.create(booking_body(n, date="2099-01-01"))
+
+
+def test_update_with_stale_version_is_412_with_current_version(service):
+    booking = create(service)
+    service.patch_booking(booking["id"], BookingUpdate(description="v2"))
+
+    with pytest.raises(HTTPException) as caught:
+        service.patch_booking(booking["id"], BookingUpdate(description="v3"), expected_version=1)
+
+    assert caught.value.status_code == 412
+    assert caught.value.detail["error"]["details"]["current_version"] == 2
+
+
+def test_update_of_missing_booking_is_404(service):
+    with pytest.raises(HTTPException) as caught:
+        service.patch_booking(999, BookingUpdate(description="x"), expected_version=1)
+
+    assert caught.value.status_code == 404
+
+
+def test_unconditional_update_skips_the_version_check(service):
+    booking = create(service)
+    service.patch_booking(booking["id"], BookingUpdate(description="v2"))
+
+    row, fields = service.patch_booking(booking["id"], BookingUpdate(description="v3"))
+
+    assert (row["version"], fields) == (3, ["description"])
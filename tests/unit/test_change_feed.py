@@ -0,0 +1,88 @@
+import asyncio
+
+from app.services.change_feed import ChangeFeed
+
+
+def _drain(subscriber):
+    events = []
+    while not subscriber.queue.empty():
+        events.append(subscriber.queue.get_nowait())
+    return events
+
+
+def _run_feed(scenario, **kwargs):
+    async def main():
+        feed = ChangeFeed(**kwargs)
+        feed.bind_loop(asyncio.get_running_loop())
+
+        async def publish(count, day="2099-01-01"):
+            for i in range(count):
+                feed.publish("created", {"id": i, "date": day})
+            await asyncio.sleep(0)  # let the fan-out run
+
+        return await scenario(feed, publish)
+
+    return asyncio.run(main())
+
+
+def test_resume_replays_retained_events():
+    async def scenario(feed, publish):
+        await publish(3)
+        subscriber = feed.subscribe(feed.event_id({"seq": 1}))
+        return [event["seq"] for event in _drain(subscriber)]
+
+    assert _run_feed(scenario) == [2, 3]
+
+
+def test_resume_from_another_origin_resets_and_goes_live():
+    async def scenario(feed, publish):
+        await publish(1)
+        subscriber = feed.subscribe(f"{ChangeFeed().origin}:50")
+        await publish(3)
+        return _drain(subscriber)
+
+    events = _run_feed(scenario)
+    assert events[0]["type"] == "reset"
+    assert [event["seq"] for event in events[1:]] == [2, 3, 4]
+
+
+def test_resume_ahead_of_the_feed_resets():
+    async def scenario(feed, publish):
+        await publish(2)
+        subscriber = feed.subscribe(feed.event_id({"seq": 50}))
+        await publish(1)
+        return _drain(subscriber)
+
+    events = _run_feed(scenario)
+    assert (events[0]["type"], events[0]["seq"]) == ("reset", 2)
+    assert [event["seq"] for event in events[1:]] == [3]
+
+
+def test_backlog_larger_than_buffer_resets_instead_of_disconnecting():
+    async def scenario(feed, publish):
+        await publish(10)
+        first = _drain(feed.subscribe(feed.event_id({"seq": 1})))
+        subscriber = feed.subscribe(feed.event_id({"seq": 1}))
+        await publish(1)
+        return first, _drain(subscriber)
+
+    first, second = _run_feed(scenario, buffer_size=5)
+    assert [(e["type"], e.get("reason"), e["seq"]) for e in first] == [("reset", "backlog_too_large", 10)]
+    # The reset's id moves the client forward; new events still arrive
+    assert [e["type"] for e in second] == ["reset", "created"]
+    assert second[1]["seq"] == 11
+
+
+def test_bulk_reset_only_reaches_overlapping_date_filters():
+    async def scenario(feed, publish):
+        inside = feed.subscribe(None, "2099-01-01", "2099-01-31")
+        outside = feed.subscribe(None, "2099-06-01", None)
+        feed.publish_reset("bulk_import", "2099-01-05", "2099-01-07", imported=2)
+        await asyncio.sleep(0)
+        return _drain(inside), _drain(outside)
+
+    inside, outside = _run_feed(scenario)
+    assert [(e["type"], e["reason"]) for e in inside] == [("reset", "bulk_import")]
+    assert outside == []
+
+
@@ -0,0 +1,32 @@
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings, settings
+from app.middleware.load_shedding import AdaptiveConcurrencyLimiter
+
+
+def test_limiter_backs_off_once_per_window():
+    limiter = AdaptiveConcurrencyLimiter(32, 4, 64, target_latency=0.1)
+    burst = [limiter.try_acquire() for _ in range(32)]
+    for seq in burst:
+        limiter.release(seq, latency=1.0)
+    assert limiter.limit == pytest.approx(32 * 0.9)
+
+    # Admitted after the decrease: may back off again
+    limiter.release(limiter.try_acquire(), latency=1.0)
+    assert limiter.limit == pytest.approx(32 * 0.9 * 0.9)
+
+    # No latency feedback (long-running routes)
+    limiter.release(limiter.try_acquire(), latency=None)
+    assert limiter.limit == pytest.approx(32 * 0.9 * 0.9)
+
+
+def test_default_concurrency_limits_fit_the_threadpool():
+    assert settings.READ_CONCURRENCY_MAX + settings.WRITE_CONCURRENCY_MAX <= settings.THREADPOOL_SIZE
+
+
+def test_concurrency_limits_beyond_the_threadpool_are_rejected():
+    with pytest.raises(ValidationError):
+        Settings(THREADPOOL_SIZE=20, READ_CONCURRENCY_MAX=16, WRITE_CONCURRENCY_MAX=8)
+    with pytest.raises(ValidationError):
+        Settings(READ_CONCURRENCY_INITIAL=30)
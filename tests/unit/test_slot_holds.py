@@ -0,0 +1,49 @@
+import pytest
+
+from app.services.slot_holds import SlotHoldManager
+from app.utils.database import SlotConflictError
+
+
+def test_hold_blocks_slot_until_released():
+    holds = SlotHoldManager(use_redis=False)
+    hold = holds.create("2099-01-01", "10:00:00", ttl_seconds=60)
+
+    assert holds.is_held("2099-01-01", "10:00:00")
+    assert not holds.is_held("2099-01-01", "10:00:00", exclude=hold.hold_id)
+    assert holds.held_slots("2099-01-01", "2099-01-01") == [("2099-01-01", "10:00:00")]
+
+    assert holds.release(hold.hold_id)
+    assert not holds.is_held("2099-01-01", "10:00:00")
+
+
+def test_expired_hold_frees_slot_but_claimed_hold_does_not_expire():
+    holds = SlotHoldManager(use_redis=False)
+    expired = holds.create("2099-01-01", "10:00:00", ttl_seconds=0)
+    claimed = holds.create("2099-01-01", "11:00:00", ttl_seconds=0)
+    holds._holds[claimed.hold_id].claimed = True
+
+    assert holds.get(expired.hold_id) is None
+    assert not holds.is_held("2099-01-01", "10:00:00")
+    assert holds.is_held("2099-01-01", "11:00:00")
+
+    holds.unclaim(claimed.hold_id)
+    assert not holds.is_held("2099-01-01", "11:00:00")
+
+
+def test_hold_can_only_be_claimed_once():
+    holds = SlotHoldManager(use_redis=False)
+    hold = holds.create("2099-01-01", "10:00:00", ttl_seconds=60)
+
+    assert holds.claim(hold.hold_id) is hold
+    assert holds.claim(hold.hold_id) is None
+
+
+def test_slot_taken_on_another_node_drops_the_local_reservation(monkeypatch):
+    holds = SlotHoldManager(use_redis=True)
+    monkeypatch.setattr(holds, "_redis_create", lambda hold, ttl_seconds: False)
+
+    with pytest.raises(SlotConflictError):
+        holds.create("2099-01-01", "10:00:00", ttl_seconds=60)
+
+    assert len(holds) == 0
+    assert holds.held_slots("2099-01-01", "2099-01-01") == []
@@ -0,0 +1,115 @@
+import sqlite3
+import threading
+
+import pytest
+
+from app.utils.write_queue import WriteQueue, WriteTimeoutError
+
+
+@pytest.fixture
+def write_queue(tmp_path):
+    db_name = str(tmp_path / "queue.db")
+    conn = sqlite3.connect(db_name)
+    conn.execute("CREATE TABLE items (value INTEGER UNIQUE)")
+    conn.commit()
+    conn.close()
+
+    queue = WriteQueue(db_name, max_batch_wait=0, timeout=5)
+    queue.start()
+    yield queue
+    queue.stop()
+
+
+def _insert(value):
+    return lambda conn: conn.execute("INSERT INTO items VALUES (?)", (value,)).rowcount
+
+
+def _submit_as_one_batch(queue, ops):
+    """Hold the writer on a blocking op so `ops` are drained into one batch."""
+    running, gate = threading.Event(), threading.Event()
+
+    def block(conn):
+        running.set()
+        gate.wait(5)
+
+    blocker = queue.submit(block)
+    running.wait(5)
+    futures = [queue.submit(op) for op in ops]
+    gate.set()
+    blocker.result(5)
+    return futures
+
+
+def _values(queue):
+    return [row[0] for row in queue.execute(
+        lambda conn: conn.execute("SELECT value FROM items ORDER BY value").fetchall()
+    )]
+
+
+def test_failed_write_is_rolled_back_alone(write_queue):
+    write_queue.execute(_insert(2))
+
+    ok_before, duplicate, ok_after = _submit_as_one_batch(
+        write_queue, [_insert(1), _insert(2), _insert(3)]
+    )
+
+    assert ok_before.result(5) == 1
+    with pytest.raises(sqlite3.IntegrityError):
+        duplicate.result(5)
+    assert ok_after.result(5) == 1
+    assert _values(write_queue) == [1, 2, 3]
+
+
+def test_lost_transaction_fails_the_batch_and_keeps_the_writer(write_queue):
+    def lose_transaction(conn):
+        # What SQLite does on SQLITE_FULL / IOERR / interrupt
+        conn.execute("ROLLBACK")
+        raise sqlite3.OperationalError("database or disk is full")
+
+    futures = _submit_as_one_batch(write_queue, [_insert(1), lose_transaction, _insert(3)])
+
+    for future in futures:
+        with pytest.raises(sqlite3.OperationalError):
+            future.result(5)
+    assert write_queue.execute(_insert(4)) == 1
+    assert _values(write_queue) == [4]
+
+
+def test_dead_writer_is_restarted(write_queue):
+    write_queue.stop()
+    write_queue._thread = threading.Thread(target=lambda: None)  # never started
+
+    assert write_queue.execute(_insert(1)) == 1
+
+
+def test_timeout_on_a_queued_write_cancels_it(write_queue):
+    running, gate = threading.Event(), threading.Event()
+    write_queue.submit(lambda conn: (running.set(), gate.wait(5)))
+    running.wait(5)
+    write_queue.timeout = 0.05
+
+    with pytest.raises(WriteTimeoutError) as caught:
+        write_queue.execute(_insert(1))
+    gate.set()
+
+    assert caught.value.started is False
+    write_queue.timeout = 5
+    assert _values(write_queue) == []
+
+
+def test_timeout_on_a_running_write_reports_unknown_outcome(write_queue):
+    gate = threading.Event()
+
+    def slow_insert(conn):
+        gate.wait(5)
+        return _insert(1)(conn)
+
+    write_queue.timeout = 0.05
+    with pytest.raises(WriteTimeoutError) as caught:
+        write_queue.execute(slow_insert)
+    gate.set()
+
+    assert caught.value.started is True
+    write_queue.timeout = 5
+    # It still committed after the caller gave up
+    assert _values(write_queue) == [1]